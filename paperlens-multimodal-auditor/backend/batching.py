@@ -0,0 +1,153 @@
+"""
+Gemini Request Batching
+Packs small concurrent requests from different audits into one model call.
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from model_router import Phase
+
+
+SendFn = Callable[[str, int], Tuple[str, Optional[str]]]
+
+
+class _PendingRequest:
+    """A prompt waiting for its share of a batched response."""
+
+    def __init__(self, prompt: str):
+        self.prompt = prompt
+        self.done = threading.Event()
+        self.result: Optional[Tuple[str, Optional[str]]] = None
+        self.error: Optional[BaseException] = None
+
+
+def _strip_code_fence(text: str) -> str:
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+    return text
+
+
+class GeminiBatcher:
+    """
+    Collects compatible (same-phase) requests within a short window and sends
+    them as one multi-item prompt, then splits the JSON response by id.
+
+    The first caller in a window becomes the leader and waits up to
+    max_wait_ms for others to join, but only while other requests are in
+    flight, so a lone audit is never delayed.
+    """
+
+    def __init__(self, send: SendFn, max_batch_size: int = 8, max_wait_ms: int = 50):
+        self._send = send
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self._cond = threading.Condition()
+        self._queues: Dict[Phase, List[_PendingRequest]] = {}
+        self._inflight = 0
+        self.batches_sent = 0
+        self.requests_batched = 0
+
+    def submit(self, prompt: str, phase: Phase) -> Tuple[str, Optional[str]]:
+        """Send a prompt, possibly batched with others. Blocks until answered."""
+        request = _PendingRequest(prompt)
+        batch: Optional[List[_PendingRequest]] = None
+
+        with self._cond:
+            self._inflight += 1
+            queue = self._queues.setdefault(phase, [])
+            queue.append(request)
+            self._cond.notify_all()
+
+            if len(queue) == 1:
+                # Leader: wait for the batch to fill, the window to close,
+                # or for there to be nobody left who could join
+                deadline = time.monotonic() + self.max_wait
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if (
+                        len(queue) >= self.max_batch_size
+                        or self._inflight <= len(queue)
+                        or remaining <= 0
+                    ):
+                        break
+                    self._cond.wait(timeout=remaining)
+                batch = self._queues.pop(phase)
+
+        try:
+            if batch is not None:
+                # Late joiners can overfill the queue before the leader wakes
+                for start in range(0, len(batch), self.max_batch_size):
+                    self._dispatch(batch[start:start + self.max_batch_size], phase)
+            request.done.wait()
+        finally:
+            with self._cond:
+                self._inflight -= 1
+                self._cond.notify_all()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _dispatch(self, batch: List[_PendingRequest], phase: Phase) -> None:
+        try:
+            if len(batch) == 1:
+                batch[0].result = self._send(batch[0].prompt, phase)
+                return
+
+            print(f"[Phase {phase}] Batching {len(batch)} requests into one call")
+            ids = [f"r{i}" for i in range(len(batch))]
+            response_text, thought_sig = self._send(self._pack(batch, ids), phase)
+            answers = self._unpack(response_text)
+            self.batches_sent += 1
+            self.requests_batched += len(batch)
+
+            for request_id, request in zip(ids, batch):
+                if request_id in answers:
+                    request.result = (answers[request_id], thought_sig)
+                else:
+                    # Model dropped or mangled this item; ask for it alone
+                    print(f"[Phase {phase}] Batch response missing {request_id}, retrying individually")
+                    request.result = self._send(request.prompt, phase)
+        except Exception as e:
+            for request in batch:
+                if request.result is None:
+                    request.error = e
+        finally:
+            for request in batch:
+                request.done.set()
+
+    @staticmethod
+    def _pack(batch: List[_PendingRequest], ids: List[str]) -> str:
+        sections = "\n\n".join(
+            f"=== REQUEST {request_id} ===\n{request.prompt}\n=== END REQUEST {request_id} ==="
+            for request_id, request in zip(ids, batch)
+        )
+        return f"""You are answering {len(batch)} independent requests in one response.
+Answer each request exactly as it instructs, without letting the others influence it.
+
+{sections}
+
+Return ONLY a valid JSON object in this exact format, no markdown, no explanation:
+{{"responses": [{{"id": "r0", "response": <the JSON value request r0 asks for>}}]}}
+Include one entry per request id."""
+
+    @staticmethod
+    def _unpack(response_text: str) -> Dict[str, str]:
+        """Split a batched response into per-id JSON strings; {} if unparseable."""
+        try:
+            parsed = json.loads(_strip_code_fence(response_text))
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(parsed, dict) or not isinstance(parsed.get("responses"), list):
+            return {}
+        answers = {}
+        for item in parsed["responses"]:
+            if isinstance(item, dict) and "id" in item and "response" in item:
+                answers[str(item["id"])] = json.dumps(item["response"])
+        return answers
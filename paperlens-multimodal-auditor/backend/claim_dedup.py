@@ -0,0 +1,185 @@
+"""
+Claim Deduplication Module
+Clusters near-duplicate claims with MinHash/LSH so each is verified once.
+"""
+
+import re
+import zlib
+from typing import List, Dict, Tuple
+from models import Claim
+
+
+NUM_HASHES = 32
+LSH_BANDS = 16  # NUM_HASHES / LSH_BANDS rows per band
+SHINGLE_SIZE = 3  # Words per shingle
+SIMILARITY_THRESHOLD = 0.5  # Estimated Jaccard similarity to merge two claims
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Fixed coefficients keep signatures stable across processes
+_HASH_COEFFS = [
+    ((i * 0x9E3779B1 + 1) % _MERSENNE_PRIME, (i * 0x85EBCA77 + 7) % _MERSENNE_PRIME)
+    for i in range(1, NUM_HASHES + 1)
+]
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+_WORD_PATTERN = re.compile(r"[a-z]+n't|[a-z]+")
+
+# Words that fix which way a claim points; opposite claims must never merge
+_UP_WORDS = {
+    "increase", "increases", "increased", "increasing", "rise", "rises", "rose",
+    "grow", "grows", "grew", "gain", "gains", "gained", "improve", "improves",
+    "improved", "improvement", "boost", "boosts", "boosted", "higher", "more",
+    "better", "greater", "larger", "faster", "above", "exceed", "exceeds",
+    "exceeded", "outperform", "outperforms", "outperformed", "outperforming",
+}
+_DOWN_WORDS = {
+    "decrease", "decreases", "decreased", "decreasing", "drop", "drops", "dropped",
+    "fall", "falls", "fell", "decline", "declines", "declined", "reduce", "reduces",
+    "reduced", "reduction", "degrade", "degrades", "degraded", "lower", "lowers",
+    "lowered", "less", "worse", "smaller", "fewer", "slower", "below",
+    "underperform", "underperforms", "underperformed", "underperforming",
+}
+_NEGATION_WORDS = {"not", "no", "never", "cannot", "without", "fail", "fails", "failed"}
+
+
+def _normalize_number(number: str) -> str:
+    value = float(number)
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+def _normalize(text: str) -> List[str]:
+    tokens = re.findall(r"\d+(?:\.\d+)?|[a-z]+|%", text.lower())
+    return [_normalize_number(t) if t[0].isdigit() else t for t in tokens]
+
+
+def number_signature(text: str) -> Tuple[str, ...]:
+    """Sorted numbers in a claim, normalized so "12.0" == "12"."""
+    return tuple(sorted({_normalize_number(n) for n in _NUMBER_PATTERN.findall(text)}))
+
+
+def direction_signature(text: str) -> Tuple[str, ...]:
+    """
+    Which way a claim points: "up" / "down" words it uses, plus "negated"
+    if it contains an odd number of negations.
+    """
+    words = _WORD_PATTERN.findall(text.lower().replace("\u2019", "'"))
+    directions = set()
+    negations = 0
+    for word in words:
+        if word in _UP_WORDS:
+            directions.add("up")
+        elif word in _DOWN_WORDS:
+            directions.add("down")
+        elif word in _NEGATION_WORDS or word.endswith("n't"):
+            negations += 1
+    if negations % 2:
+        directions.add("negated")
+    return tuple(sorted(directions))
+
+
+def claim_key(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Claims may only merge when they cite the same numbers in the same direction."""
+    return number_signature(text), direction_signature(text)
+
+
+def minhash_signature(text: str) -> List[int]:
+    """MinHash signature over word shingles."""
+    words = _normalize(text)
+    if len(words) < SHINGLE_SIZE:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    hashed = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashed) for a, b in _HASH_COEFFS]
+
+
+def _is_duplicate(sig_a: List[int], sig_b: List[int]) -> bool:
+    """Similarity test for two claims already known to share a claim_key."""
+    similarity = sum(a == b for a, b in zip(sig_a, sig_b)) / NUM_HASHES
+    return similarity >= SIMILARITY_THRESHOLD
+
+
+def cluster_claims(claims: List[Claim]) -> List[List[Claim]]:
+    """
+    Group near-duplicate claims.
+
+    Candidate pairs come from LSH buckets, so the cost is roughly linear in
+    the number of claims. A pair is merged only when both claims cite the
+    same numbers in the same direction (restated results, not different or
+    opposite results) and its estimated Jaccard similarity passes the
+    threshold.
+
+    Returns:
+        Clusters in first-seen order; each cluster starts with its
+        representative (the highest-confidence member).
+    """
+    if not claims:
+        return []
+
+    signatures = [minhash_signature(c.text) for c in claims]
+    keys = [claim_key(c.text) for c in claims]
+
+    parent = list(range(len(claims)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    rows = NUM_HASHES // LSH_BANDS
+    for band in range(LSH_BANDS):
+        buckets: Dict[tuple, int] = {}
+        for i, sig in enumerate(signatures):
+            # Bucketing by claim_key keeps incompatible claims from ever pairing
+            key = (keys[i], tuple(sig[band * rows:(band + 1) * rows]))
+            j = buckets.setdefault(key, i)
+            if j == i or find(i) == find(j):
+                continue
+            if _is_duplicate(signatures[i], signatures[j]):
+                parent[find(i)] = find(j)
+
+    groups: Dict[int, List[Claim]] = {}
+    for i, claim in enumerate(claims):
+        groups.setdefault(find(i), []).append(claim)
+
+    clusters = []
+    for members in groups.values():
+        representative = max(members, key=lambda c: c.confidence)
+        clusters.append([representative] + [c for c in members if c is not representative])
+    return clusters
+
+
+class IncrementalClaimClusterer:
+    """
+    Online variant of cluster_claims for claims that arrive one at a time
+    (e.g. streamed from Phase 1). The first-seen claim represents its cluster.
+    """
+
+    def __init__(self):
+        self.clusters: List[List[Claim]] = []
+        self._signatures: List[List[int]] = []
+        self._buckets: Dict[tuple, int] = {}  # (claim_key, band, rows) -> cluster
+
+    def add(self, claim: Claim) -> bool:
+        """Add a claim; True if it starts a new cluster, False if it is a duplicate."""
+        signature = minhash_signature(claim.text)
+        key = claim_key(claim.text)
+        rows = NUM_HASHES // LSH_BANDS
+        bucket_keys = [
+            (key, band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(LSH_BANDS)
+        ]
+
+        for bucket_key in bucket_keys:
+            index = self._buckets.get(bucket_key)
+            if index is None:
+                continue
+            if _is_duplicate(signature, self._signatures[index]):
+                self.clusters[index].append(claim)
+                return False
+
+        index = len(self.clusters)
+        self.clusters.append([claim])
+        self._signatures.append(signature)
+        for bucket_key in bucket_keys:
+            self._buckets.setdefault(bucket_key, index)
+        return True
@@ -0,0 +1,155 @@
+"""
+Figure Cache
+Persistent perceptual-hash -> figure description store, shared across documents.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+
+FIGURE_CACHE_PATH = os.getenv(
+    "FIGURE_CACHE_PATH", os.path.join(os.path.dirname(__file__), "reports", "figure_cache.sqlite3")
+)
+FIGURE_MATCH_DISTANCE = int(os.getenv("FIGURE_MATCH_DISTANCE", "6"))  # Max Hamming distance (bits)
+FIGURE_CACHE_MAX_ENTRIES = int(os.getenv("FIGURE_CACHE_MAX_ENTRIES", "10000"))
+HASH_BITS = 64
+BANDS = 8  # Any two hashes within 7 bits share at least one identical 8-bit band
+
+_BAND_COLUMNS = [f"band{i}" for i in range(BANDS)]
+
+
+def hamming_distance(a: str, b: str) -> int:
+    """Number of differing bits between two hex-encoded hashes."""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def _bands(phash: str) -> List[Tuple[int, int]]:
+    value = int(phash, 16)
+    band_bits = HASH_BITS // BANDS
+    mask = (1 << band_bits) - 1
+    return [(i, (value >> (i * band_bits)) & mask) for i in range(BANDS)]
+
+
+class FigureCache:
+    """
+    Near-match lookup of previously analyzed figures.
+
+    Entries live in SQLite, so every worker process reads and writes the
+    same store and an insert never overwrites another worker's entries.
+    Each hash is indexed by its 8-bit bands; a lookup only compares against
+    figures sharing a band. The least recently used entries are evicted
+    beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        path: str = FIGURE_CACHE_PATH,
+        max_distance: int = FIGURE_MATCH_DISTANCE,
+        max_entries: int = FIGURE_CACHE_MAX_ENTRIES
+    ):
+        self.path = path
+        self.max_distance = min(max_distance, BANDS - 1)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = self._connect()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not open figure cache {self.path}: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        band_columns = ", ".join(f"{column} INTEGER NOT NULL" for column in _BAND_COLUMNS)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS figures ("
+            "phash TEXT PRIMARY KEY, description TEXT NOT NULL, "
+            f"created_at REAL NOT NULL, last_used REAL NOT NULL, {band_columns})"
+        )
+        for column in _BAND_COLUMNS:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS figures_{column} ON figures ({column})")
+        conn.execute("CREATE INDEX IF NOT EXISTS figures_last_used ON figures (last_used)")
+        conn.commit()
+        return conn
+
+    def lookup(self, phash: str) -> Optional[Dict[str, Any]]:
+        """Closest cached entry within max_distance bits, or None."""
+        with self._lock:
+            best = None
+            if self._conn is not None:
+                where = " OR ".join(f"{column} = ?" for column in _BAND_COLUMNS)
+                try:
+                    rows = self._conn.execute(
+                        f"SELECT phash, description, created_at FROM figures WHERE {where}",
+                        [value for _, value in _bands(phash)],
+                    ).fetchall()
+                    best_distance = self.max_distance + 1
+                    for candidate, description, created_at in rows:
+                        distance = hamming_distance(phash, candidate)
+                        if distance < best_distance:
+                            best, best_distance = (candidate, description, created_at), distance
+                    if best is not None:
+                        self._conn.execute(
+                            "UPDATE figures SET last_used = ? WHERE phash = ?", (time.time(), best[0])
+                        )
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"⚠️ Figure cache lookup failed: {e}")
+                    best = None
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return {"description": best[1], "created_at": best[2]}
+
+    def add(self, phash: str, description: str) -> None:
+        """Store a figure description, evicting the least recently used beyond max_entries."""
+        with self._lock:
+            if self._conn is None:
+                return
+            now = time.time()
+            columns = ", ".join(_BAND_COLUMNS)
+            placeholders = ", ".join("?" for _ in _BAND_COLUMNS)
+            try:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO figures (phash, description, created_at, last_used, {columns}) "
+                    f"VALUES (?, ?, ?, ?, {placeholders})",
+                    [phash, description, now, now] + [value for _, value in _bands(phash)],
+                )
+                self._conn.execute(
+                    "DELETE FROM figures WHERE phash IN ("
+                    "SELECT phash FROM figures ORDER BY last_used DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Could not save figure cache entry: {e}")
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _entry_count(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            try:
+                return self._conn.execute("SELECT COUNT(*) FROM figures").fetchone()[0]
+            except sqlite3.Error:
+                return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache metrics; entries are shared by all workers, hits/misses are this process's."""
+        return {
+            "entries": self._entry_count(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+        }
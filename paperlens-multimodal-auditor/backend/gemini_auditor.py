@@ -6,12 +6,25 @@ Implements thought-signature propagation and robust error handling.
 
 import json
 import os
+import re
 import base64
+import threading
 import time
-from typing import List, Dict, Any, Optional, Tuple
-from google import genai
-from google.api_core import exceptions as api_exceptions
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from models import Claim, Contradiction, AuditReport
+from normalization import split_pages, join_pages
+from claim_dedup import cluster_claims, IncrementalClaimClusterer
+from batching import GeminiBatcher
+from governor import ResourceGovernor, BudgetExceeded
+from normalization import estimate_tokens
+from figure_cache import FigureCache
+from model_router import ModelRouter, Phase, FUSED_PHASE
+from stream_parser import JSONArrayStreamParser
+
+IMAGE_TOKENS = 258  # Approximate Gemini token cost of one image
+MIN_FIGURE_PIXELS = 100  # Skip logos and icons smaller than this on either side
+STREAM_VERIFY_GROUP_SIZE = 5  # Phase 2/3 prompts take at most 5 claims
 
 
 class MultimodalAuditor:
@@ -20,26 +33,195 @@ class MultimodalAuditor:
     def __init__(self, api_key: str = None):
         if api_key is None:
             api_key = os.getenv("GOOGLE_API_KEY")
-        self.client = genai.Client(api_key=api_key)
+        if not api_key:
+            raise ValueError("GOOGLE_API_KEY is not set")
+        self.api_key = api_key
+        self._client = None  # Created on first use; see client property
         self.model = "gemini-2.0-flash"  # Use stable model
-        self.thought_signatures: Dict[int, Optional[str]] = {}  # Track signatures across phases
+        # Per-phase models with latency-aware fallback (see model_router.py)
+        self.router = ModelRouter.from_env(default_model=os.getenv("GEMINI_MODEL", self.model))
+        self.thought_signatures: Dict[Phase, Optional[str]] = {}  # Track signatures across phases
         self.max_retries = 3
         self.retry_delay = 2  # seconds
+        # Per-request state (e.g. the resource governor); one auditor serves concurrent audits
+        self._local = threading.local()
+        # Model calls run here so they can be abandoned at the phase deadline
+        self._call_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("GEMINI_CALL_WORKERS", "16")), thread_name_prefix="gemini-call"
+        )
+        # Figure descriptions shared across documents, keyed by perceptual hash
+        self.figure_cache = FigureCache()
+        # Opt-in: every uncached figure costs an extra image call before Phase 2
+        self.max_figures = int(os.getenv("FIGURE_ANALYSIS_MAX", "0"))
+        self.figure_concurrency = max(1, int(os.getenv("FIGURE_ANALYSIS_CONCURRENCY", "4")))
+        # Streamed Phase 1 with verification overlapping extraction
+        self.stream_claims = os.getenv("GEMINI_STREAM_CLAIMS", "false").lower() in ("1", "true", "yes")
+        self.stream_verify_max_groups = max(1, int(os.getenv("STREAM_VERIFY_MAX_GROUPS", "1")))
+        # Fused mode runs Phases 2 and 3 as a single structured call
+        self.fused_verification = os.getenv("GEMINI_FUSED_VERIFICATION", "false").lower() in ("1", "true", "yes")
+        
+        # Optional cross-request micro-batching (see batching.py)
+        self.batcher: Optional[GeminiBatcher] = None
+        self.batch_phases = {
+            int(p) for p in os.getenv("GEMINI_BATCH_PHASES", "2,3").split(",") if p.strip()
+        }
+        if os.getenv("GEMINI_BATCHING", "false").lower() in ("1", "true", "yes"):
+            self.batcher = GeminiBatcher(
+                self._generate_with_retry,
+                max_batch_size=int(os.getenv("GEMINI_BATCH_MAX_SIZE", "8")),
+                max_wait_ms=int(os.getenv("GEMINI_BATCH_MAX_WAIT_MS", "50")),
+            )
+    
+    @property
+    def client(self):
+        """Gemini client, imported and constructed on first use to keep startup fast."""
+        if self._client is None:
+            from google import genai
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+    
+    @property
+    def client_ready(self) -> bool:
+        return self._client is not None
+    
+    def warm_up(self) -> None:
+        """Import the Gemini SDK and build the client ahead of the first audit."""
+        start = time.time()
+        _ = self.client
+        from google.api_core import exceptions  # noqa: F401
+        print(f"✅ Gemini client warmed up in {time.time() - start:.2f}s")
+    
+    @property
+    def _request(self) -> Dict[str, Any]:
+        """State of the audit running on this thread (empty outside run_* calls)."""
+        return getattr(self._local, "request", None) or {}
+    
+    @property
+    def _governor(self) -> Optional[ResourceGovernor]:
+        return self._request.get("governor")
+    
+    def _start_phase(self, name: str) -> None:
+        request = self._request
+        # While phases overlap (streaming), the caller times them as one
+        if request.get("governor") is not None and not request.get("overlapping_phases"):
+            request["governor"].start_phase(name)
+    
+    def _begin_request(self, governor: Optional[ResourceGovernor]) -> None:
+        self._local.request = {
+            "governor": governor,
+            "figure_stats": {"lookups": 0, "hits": 0},
+            "figures_section": None,
+            "figures_lock": threading.Lock(),
+            "overlapping_phases": False,
+        }
+    
+    def _end_request(self) -> None:
+        self._local.request = None
+    
+    def _run_with_request(self, request: Dict[str, Any], fn, *args):
+        """Run fn on a worker thread with the caller's request state."""
+        self._local.request = request
+        try:
+            return fn(*args)
+        finally:
+            self._local.request = None
+    
+    def _call_with_deadline(self, fn, *args, **kwargs):
+        """
+        Run a blocking model call, giving up once the current phase's time
+        budget runs out (the abandoned call finishes in the background).
+        """
+        governor = self._governor
+        timeout = governor.phase_seconds_left() if governor is not None else None
+        if timeout is None:
+            return fn(*args, **kwargs)
+        future = self._call_pool.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise governor.phase_timed_out()
+    
+    def _figure_cache_stats(self) -> Dict[str, Any]:
+        """This request's figure-cache lookups, plus the process-wide hit rate."""
+        stats = self._request.get("figure_stats") or {"lookups": 0, "hits": 0}
+        lookups, hits = stats["lookups"], stats["hits"]
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "model_calls_saved": hits,
+            "overall_hit_rate": round(self.figure_cache.hit_rate, 3),
+        }
     
-    def _call_gemini_with_retry(self, prompt: str, phase: int = 1) -> Tuple[str, Optional[str]]:
+    def _call_gemini_with_retry(
+        self,
+        prompt: str,
+        phase: Phase = 1,
+        images: Optional[List[Any]] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Call Gemini, batching with concurrent audits' requests when enabled.
+        Calls that carry images are never batched.
+        
+        Raises BudgetExceeded if the request's governor has no budget left.
+        
+        Returns: (response_text, thought_signature)
+        """
+        governor = self._governor
+        prompt_tokens = estimate_tokens(prompt) + IMAGE_TOKENS * len(images or [])
+        if governor is not None:
+            governor.check_model_call(prompt_tokens)
+        
+        batchable = phase in self.batch_phases or (phase == FUSED_PHASE and bool(self.batch_phases & {2, 3}))
+        try:
+            if self.batcher is not None and batchable and not images:
+                response_text, thought_sig = self.batcher.submit(prompt, phase)
+            else:
+                response_text, thought_sig = self._generate_with_retry(prompt, phase, images)
+        except BudgetExceeded as e:
+            # A batched call can run out on another audit's deadline; record it here too
+            if governor is not None and e.budget == "phase_seconds":
+                governor.phase_timed_out()
+            raise
+        
+        if governor is not None:
+            governor.record_model_call(prompt_tokens + estimate_tokens(response_text or ""))
+        return response_text, thought_sig
+    
+    def _generate_with_retry(
+        self,
+        prompt: str,
+        phase: Phase = 1,
+        images: Optional[List[Any]] = None
+    ) -> Tuple[str, Optional[str]]:
         """
         Call Gemini API with exponential backoff retry logic and thought-signature tracking.
         
+        The model comes from the router; each retry falls back to the next
+        candidate for the phase, and every outcome feeds the router's stats.
+        
         Returns: (response_text, thought_signature)
         """
+        from google.api_core import exceptions as api_exceptions
+        
+        kind = "image" if images else "text"
+        candidates = self.router.candidates(phase, kind)
         for attempt in range(self.max_retries):
             try:
-                print(f"[Phase {phase}] API call (attempt {attempt + 1}/{self.max_retries})")
+                model = candidates[min(attempt, len(candidates) - 1)]
+                print(f"[Phase {phase}] API call to {model} (attempt {attempt + 1}/{self.max_retries})")
                 
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=prompt,
-                )
+                call_start = time.time()
+                try:
+                    response = self._call_with_deadline(
+                        self.client.models.generate_content,
+                        model=model,
+                        contents=[prompt, *images] if images else prompt,
+                    )
+                except Exception:
+                    self.router.record(model, time.time() - call_start, ok=False, phase=phase, kind=kind)
+                    raise
+                self.router.record(model, time.time() - call_start, ok=True, phase=phase, kind=kind)
                 
                 # Extract thought signature if present
                 thought_sig = None
@@ -50,6 +232,9 @@ class MultimodalAuditor:
                 
                 return response.text, thought_sig
             
+            except BudgetExceeded:
+                raise  # Out of phase time; retrying cannot help
+            
             except api_exceptions.ResourceExhausted as e:
                 print(f"[Phase {phase}] Rate limited: {e}")
                 if attempt < self.max_retries - 1:
@@ -79,6 +264,52 @@ class MultimodalAuditor:
         
         raise RuntimeError(f"Failed after {self.max_retries} attempts")
     
+    def _stream_gemini(self, prompt: str, phase: Phase = 1) -> Iterator[str]:
+        """
+        Stream a Gemini response as text pieces.
+        
+        Retries (falling back through the router's candidates) only if the
+        stream fails before producing any output.
+        """
+        governor = self._governor
+        prompt_tokens = estimate_tokens(prompt)
+        if governor is not None:
+            governor.check_model_call(prompt_tokens)
+        
+        candidates = self.router.candidates(phase, "stream")
+        for attempt in range(self.max_retries):
+            model = candidates[min(attempt, len(candidates) - 1)]
+            print(f"[Phase {phase}] Streaming API call to {model} (attempt {attempt + 1}/{self.max_retries})")
+            
+            call_start = time.time()
+            received: List[str] = []
+            try:
+                stream = self._call_with_deadline(
+                    self.client.models.generate_content_stream, model=model, contents=prompt
+                )
+                stream = iter(stream)
+                # Each read is bounded by the phase's remaining time
+                while True:
+                    chunk = self._call_with_deadline(next, stream, None)
+                    if chunk is None:
+                        break
+                    piece = chunk.text or ""
+                    if piece:
+                        received.append(piece)
+                        yield piece
+            except Exception as e:
+                self.router.record(model, time.time() - call_start, ok=False, phase=phase, kind="stream")
+                if received or isinstance(e, BudgetExceeded) or attempt == self.max_retries - 1:
+                    raise
+                print(f"[Phase {phase}] Stream failed before any output: {e}")
+                time.sleep(self.retry_delay * (2 ** attempt))
+                continue
+            
+            self.router.record(model, time.time() - call_start, ok=True, phase=phase, kind="stream")
+            if governor is not None:
+                governor.record_model_call(prompt_tokens + estimate_tokens("".join(received)))
+            return
+    
     def _filter_claims(self, claims: List[Claim]) -> List[Claim]:
         if not claims:
             return []
@@ -103,12 +334,8 @@ class MultimodalAuditor:
             filtered.append(c)
         return filtered
 
-    def phase_1_extract_claims(self, text: str) -> List[Claim]:
-        """
-        Phase 1: Extract quantitative claims from text using Gemini.
-        """
-        def _extract_from_chunk(chunk: str) -> List[Claim]:
-            prompt = f"""You are a scientific claim extractor. Analyze the following research paper text 
+    def _phase_1_prompt(self, chunk: str) -> str:
+        return f"""You are a scientific claim extractor. Analyze the following research paper text 
 and extract all quantitative and comparative claims. Focus on claims with numbers, percentages, 
 increases/decreases, comparisons between conditions.
 
@@ -122,6 +349,84 @@ PAPER TEXT:
 {chunk}
 
 Return ONLY the JSON array, no markdown, no explanation."""
+
+    def _phase_1_chunks(self, text: str) -> List[str]:
+        """Start, middle and end windows of the paper, tried in order."""
+        chunks = []
+        if text:
+            chunks.append(text[:8000])
+            if len(text) > 16000:
+                mid_start = max(0, (len(text) // 2) - 4000)
+                chunks.append(text[mid_start:mid_start + 8000])
+                chunks.append(text[-8000:])
+        return chunks
+
+    def _heuristic_claims(self, text: str) -> List[Claim]:
+        """Fallback: heuristic numeric-claim extraction if Gemini yields none."""
+        claims: List[Claim] = []
+        # Keep each sentence's page so incremental re-audits reuse it correctly
+        sentences = [
+            (page_num, sentence)
+            for page_num, page_text in (split_pages(text) or [(1, text)])
+            for sentence in re.split(r"(?<=[.!?])\s+", page_text)
+        ]
+        exclude_tokens = (
+            "university",
+            "department",
+            "street",
+            "avenue",
+            "usa",
+            "canada",
+            "spain",
+            "italy",
+            "france",
+            "germany",
+            "prepared for submission",
+            "astrophysics research centre",
+        )
+        include_tokens = (
+            "we find",
+            "we obtain",
+            "we measure",
+            "we derive",
+            "we compute",
+            "result",
+            "constraint",
+            "consistent with",
+            "significant",
+            "confidence",
+        )
+
+        numeric_sentences = []
+        for page_num, s in sentences:
+            s_clean = " ".join(s.split()).strip()
+            if not s_clean or len(s_clean) < 20:
+                continue
+            s_lower = s_clean.lower()
+            if any(tok in s_lower for tok in exclude_tokens):
+                continue
+            if not re.search(r"\d", s_clean):
+                continue
+            if include_tokens and not any(tok in s_lower for tok in include_tokens):
+                continue
+            numeric_sentences.append((page_num, s_clean))
+
+        for page_num, s in numeric_sentences[:10]:
+            claims.append(Claim(
+                text=s[:300],
+                confidence=0.55,
+                page=page_num,
+                evidence_type="quantitative",
+            ))
+
+        return claims
+
+    def phase_1_extract_claims(self, text: str) -> List[Claim]:
+        """
+        Phase 1: Extract quantitative claims from text using Gemini.
+        """
+        def _extract_from_chunk(chunk: str) -> List[Claim]:
+            prompt = self._phase_1_prompt(chunk)
             try:
                 response_text, _ = self._call_gemini_with_retry(prompt, phase=1)
                 
@@ -141,75 +446,120 @@ Return ONLY the JSON array, no markdown, no explanation."""
                 return []
 
         # Try multiple chunks (start, middle, end) to avoid missing claims
-        chunks = []
-        if text:
-            chunks.append(text[:8000])
-            if len(text) > 16000:
-                mid_start = max(0, (len(text) // 2) - 4000)
-                chunks.append(text[mid_start:mid_start + 8000])
-                chunks.append(text[-8000:])
-
         claims: List[Claim] = []
-        for chunk in chunks:
+        for chunk in self._phase_1_chunks(text):
             claims = _extract_from_chunk(chunk)
             if claims:
                 break
 
         # Fallback: heuristic numeric-claim extraction if Gemini yields none
         if not claims:
-            import re
-            sentences = re.split(r"(?<=[.!?])\s+", text)
-            exclude_tokens = (
-                "university",
-                "department",
-                "street",
-                "avenue",
-                "usa",
-                "canada",
-                "spain",
-                "italy",
-                "france",
-                "germany",
-                "prepared for submission",
-                "astrophysics research centre",
-            )
-            include_tokens = (
-                "we find",
-                "we obtain",
-                "we measure",
-                "we derive",
-                "we compute",
-                "result",
-                "constraint",
-                "consistent with",
-                "significant",
-                "confidence",
-            )
-
-            numeric_sentences = []
-            for s in sentences:
-                s_clean = " ".join(s.split()).strip()
-                if not s_clean or len(s_clean) < 20:
-                    continue
-                s_lower = s_clean.lower()
-                if any(tok in s_lower for tok in exclude_tokens):
-                    continue
-                if not re.search(r"\d", s_clean):
-                    continue
-                if include_tokens and not any(tok in s_lower for tok in include_tokens):
-                    continue
-                numeric_sentences.append(s_clean)
-
-            for s in numeric_sentences[:10]:
-                claims.append(Claim(
-                    text=s[:300],
-                    confidence=0.55,
-                    page=1,
-                    evidence_type="quantitative",
-                ))
+            claims = self._heuristic_claims(text)
 
         return self._filter_claims(claims)
     
+    def phase_1_stream_claims(self, text: str) -> Iterator[Claim]:
+        """
+        Phase 1, streamed: yield each filtered Claim as soon as its JSON
+        object closes in the model output.
+        """
+        produced = False
+        for chunk in self._phase_1_chunks(text):
+            parser = JSONArrayStreamParser()
+            try:
+                for piece in self._stream_gemini(self._phase_1_prompt(chunk), phase=1):
+                    for claim_json in parser.feed(piece):
+                        try:
+                            claim = Claim(**claim_json)
+                        except Exception as e:
+                            print(f"Error in phase 1 claim parse: {e}")
+                            continue
+                        produced = True
+                        yield from self._filter_claims([claim])
+            except Exception as e:
+                print(f"Error in phase 1 stream: {e}")
+            if produced:
+                return
+        
+        # Fallback: heuristic numeric-claim extraction if Gemini yields none
+        yield from self._filter_claims(self._heuristic_claims(text))
+    
+    def _describe_figures(self, images: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Describe extracted figures, reusing cached descriptions for figures
+        seen before (in this or any other document) by perceptual hash.
+        
+        Returns: [{"page": int, "description": str, "cached": bool}]
+        """
+        figures = [
+            img for img in images
+            if img.get("phash") and min(img["image_pil"].size) >= MIN_FIGURE_PIXELS
+        ][:self.max_figures]
+        stats = self._request.get("figure_stats")
+        
+        # Cache lookups are cheap and run inline; misses are described concurrently
+        descriptions: Dict[int, Dict[str, Any]] = {}  # figure index -> description
+        misses = []
+        for index, figure in enumerate(figures):
+            cached = self.figure_cache.lookup(figure["phash"])
+            if stats is not None:
+                stats["lookups"] += 1
+            if cached is not None:
+                if stats is not None:
+                    stats["hits"] += 1
+                descriptions[index] = {"page": figure["page"], "description": cached["description"], "cached": True}
+            else:
+                misses.append((index, figure))
+        
+        if misses:
+            request = self._request
+            with ThreadPoolExecutor(max_workers=min(self.figure_concurrency, len(misses))) as pool:
+                futures = {
+                    index: pool.submit(self._run_with_request, request, self._describe_figure, figure)
+                    for index, figure in misses
+                }
+            for index, future in futures.items():
+                description = future.result()
+                if description is not None:
+                    descriptions[index] = {"page": figures[index]["page"], "description": description, "cached": False}
+        
+        if figures:
+            cached_count = sum(1 for d in descriptions.values() if d["cached"])
+            print(f"  → Described {len(descriptions)} figure(s), {cached_count} from cache")
+        return [descriptions[index] for index in sorted(descriptions)]
+    
+    def _describe_figure(self, figure: Dict[str, Any]) -> Optional[str]:
+        """Describe one figure with Gemini and cache the result (None on failure)."""
+        prompt = """Describe this figure from a research paper for a fact-checker.
+State what is plotted (axes, units, series), the main trends, and any values that can be read off.
+Plain text, at most 120 words."""
+        try:
+            response_text, _ = self._call_gemini_with_retry(prompt, phase=2, images=[figure["image_pil"]])
+        except Exception as e:
+            print(f"Error describing figure on page {figure['page']}: {e}")
+            return None
+        description = response_text.strip()
+        self.figure_cache.add(figure["phash"], description)
+        return description
+    
+    def _figures_prompt_section(self, images: List[Dict[str, Any]]) -> str:
+        """FIGURES block for the verification prompts (empty if there are none)."""
+        request = self._request
+        if not request:
+            return self._build_figures_section(images)
+        # Built once per audit; concurrent callers wait for the first one
+        with request["figures_lock"]:
+            if request["figures_section"] is None:
+                request["figures_section"] = self._build_figures_section(images)
+            return request["figures_section"]
+    
+    def _build_figures_section(self, images: List[Dict[str, Any]]) -> str:
+        descriptions = self._describe_figures(images)
+        if not descriptions:
+            return ""
+        lines = "\n".join(f"- Page {d['page']}: {d['description']}" for d in descriptions)
+        return f"\nFIGURES:\n{lines}\n"
+    
     def phase_2_visual_verification(
         self, 
         text: str, 
@@ -223,7 +573,8 @@ Return ONLY the JSON array, no markdown, no explanation."""
         if not claims:
             return {"verifications": []}
         
-        claims_text = "\n".join([f"- {c.text}" for c in claims[:5]])  # Limit to first 5
+        claims_text = "\n".join([f"- [{cid}] {c.text}" for cid, c in self._claims_with_ids(claims)])
+        figures_text = self._figures_prompt_section(images)
         
         prompt = f"""You are a scientific auditor. Analyze these claims against the text:
 
@@ -232,12 +583,13 @@ CLAIMS:
 
 TEXT:
 {text[:3000]}
-
+{figures_text}
 For each claim, determine if there is visual/numerical evidence supporting or contradicting it.
+Identify each claim by its id in brackets.
 Return ONLY valid JSON in this format:
 {{
   "verifications": [
-    {{"claim": "claim text", "visual_found": true, "supports": true, "confidence": 0.8}}
+    {{"claim_id": "c0", "claim": "claim text", "visual_found": true, "supports": true, "confidence": 0.8}}
   ]
 }}
 """
@@ -272,7 +624,10 @@ Return ONLY valid JSON in this format:
             return []
         
         verification_text = json.dumps(verifications, indent=2)
-        claims_text = json.dumps([{"text": c.text, "confidence": c.confidence} for c in claims[:5]], indent=2)
+        claims_text = json.dumps(
+            [{"id": cid, "text": c.text, "confidence": c.confidence} for cid, c in self._claims_with_ids(claims)],
+            indent=2
+        )
         
         prompt = f"""You are a scientific auditor. Based on the claims and verification results, 
 identify any contradictions.
@@ -283,9 +638,9 @@ CLAIMS:
 VERIFICATION RESULTS:
 {verification_text}
 
-Return ONLY a valid JSON array of contradictions:
+Return ONLY a valid JSON array of contradictions, each with the id of its claim:
 [
-  {{"claim": "text", "visual_evidence_page": 1, "visual_shows": "description", "contradiction_type": "direct_conflict", "confidence": 0.9, "reasoning": "explanation"}}
+  {{"claim_id": "c0", "claim": "text", "visual_evidence_page": 1, "visual_shows": "description", "contradiction_type": "direct_conflict", "confidence": 0.9, "reasoning": "explanation"}}
 ]
 
 If no contradictions found, return empty array: []
@@ -304,35 +659,280 @@ If no contradictions found, return empty array: []
             contradictions_json = json.loads(response_text)
             if not contradictions_json:
                 return []
-            contradictions = [Contradiction(**c) for c in contradictions_json]
-            return contradictions
+            return self._parse_contradictions(contradictions_json, claims)
         except Exception as e:
             print(f"Error in phase 3: {e}")
             return []
     
+    def phase_2_3_fused_verification(
+        self,
+        text: str,
+        claims: List[Claim],
+        images: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], List[Contradiction]]:
+        """
+        Fused Phases 2+3: verify claims and classify contradictions in one call.
+        
+        Returns: (verifications, contradictions)
+        """
+        
+        if not claims:
+            return {"verifications": []}, []
+        
+        claims_text = json.dumps(
+            [{"id": cid, "text": c.text, "confidence": c.confidence, "page": c.page}
+             for cid, c in self._claims_with_ids(claims)],
+            indent=2
+        )
+        figures_text = self._figures_prompt_section(images)
+        
+        prompt = f"""You are a scientific auditor. Verify these claims against the text, then flag contradictions.
+
+CLAIMS:
+{claims_text}
+
+TEXT:
+{text[:3000]}
+{figures_text}
+For each claim, determine if there is visual/numerical evidence supporting or contradicting it.
+Then, for every claim that is NOT supported, describe the contradiction.
+Identify each claim by its id.
+Return ONLY valid JSON in this format:
+{{
+  "verifications": [
+    {{"claim_id": "c0", "claim": "claim text", "visual_found": true, "supports": true, "confidence": 0.8}}
+  ],
+  "contradictions": [
+    {{"claim_id": "c0", "claim": "text", "visual_evidence_page": 1, "visual_shows": "description", "contradiction_type": "direct_conflict", "confidence": 0.9, "reasoning": "explanation"}}
+  ]
+}}
+
+If no contradictions found, use an empty array for "contradictions".
+"""
+        
+        try:
+            # Routed as its own phase so it gets the stronger of the Phase 2/3 models
+            response_text, _ = self._call_gemini_with_retry(prompt, phase=FUSED_PHASE)
+            
+            response_text = response_text.strip()
+            if response_text.startswith("```"):
+                response_text = response_text.split("```")[1]
+                if response_text.startswith("json"):
+                    response_text = response_text[4:]
+                response_text = response_text.strip()
+            
+            result = json.loads(response_text)
+            verifications = {"verifications": result.get("verifications") or []}
+            contradictions = self._parse_contradictions(result.get("contradictions") or [], claims)
+            return verifications, contradictions
+        except Exception as e:
+            print(f"Error in fused phase 2+3: {e}")
+            return {"verifications": []}, []
+    
+    @staticmethod
+    def _claims_with_ids(claims: List[Claim]) -> List[Tuple[str, Claim]]:
+        """Prompt ids (c0, c1, ...) for the claims sent to Phases 2/3 (first 5 only)."""
+        return [(f"c{i}", claim) for i, claim in enumerate(claims[:5])]
+    
+    def _parse_contradictions(
+        self,
+        contradictions_json: List[Dict[str, Any]],
+        claims: List[Claim]
+    ) -> List[Contradiction]:
+        """
+        Build Contradictions, resolving each claim_id back to the exact claim
+        that was sent, since the model often rephrases the claim text.
+        """
+        claims_by_id = dict(self._claims_with_ids(claims))
+        contradictions = []
+        for item in contradictions_json:
+            item = dict(item)
+            claim = claims_by_id.get(str(item.pop("claim_id", "")).strip())
+            if claim is not None:
+                item["claim"] = claim.text
+                item["claim_page"] = claim.page
+            contradictions.append(Contradiction(**item))
+        return contradictions
+    
+    @staticmethod
+    def _all_supported(verifications: Dict[str, Any], claims: List[Claim]) -> bool:
+        """True if Phase 2 returned a result for every claim sent and each one supports it."""
+        results = verifications.get("verifications") or []
+        if not results or len(results) < len(claims[:5]):
+            return False  # Claims without a verification still need Phase 3
+        return all(
+            isinstance(v, dict) and v.get("supports") is True for v in results
+        )
+    
     def run_full_audit(
         self,
         text: str,
         images: List[Dict[str, Any]],
-        total_pages: int
+        total_pages: int,
+        governor: Optional[ResourceGovernor] = None
     ) -> AuditReport:
         """
         Run all 3 phases and generate final audit report.
+        
+        With a governor, model calls stop once a budget is exhausted and the
+        phases return whatever they have so far.
         """
+        self._begin_request(governor)
+        try:
+            if self.stream_claims:
+                self._start_phase("streamed_extraction_and_verification")
+                print("[Phase 1] Streaming claims; verification overlaps extraction...")
+                claims, contradictions = self._stream_and_verify(text, images)
+            else:
+                self._start_phase("claim_extraction")
+                print("[Phase 1] Extracting claims...")
+                claims = self.phase_1_extract_claims(text)
+                print(f"  → Found {len(claims)} claims")
+                
+                contradictions = self._verify_claims(text, claims, images)
+            
+            report = self._build_report(claims, contradictions, total_pages)
+            report.figure_cache_stats = self._figure_cache_stats()
+            return report
+        finally:
+            self._end_request()
+    
+    def _verify_claims(
+        self,
+        text: str,
+        claims: List[Claim],
+        images: List[Dict[str, Any]]
+    ) -> List[Contradiction]:
+        """
+        Run Phases 2 and 3 on one representative per near-duplicate cluster,
+        then fan each contradiction back out to every member of its cluster.
+        """
+        if not claims:
+            return []
         
-        print("[Phase 1] Extracting claims...")
-        claims = self.phase_1_extract_claims(text)
-        print(f"  → Found {len(claims)} claims")
+        clusters = cluster_claims(claims)
+        representatives = [cluster[0] for cluster in clusters]
+        if len(representatives) < len(claims):
+            print(f"  → Collapsed {len(claims)} claims into {len(representatives)} unique claims")
         
+        contradictions = self._verify_representatives(text, representatives, images)
+        return self._fan_out(contradictions, clusters)
+    
+    def _verify_representatives(
+        self,
+        text: str,
+        representatives: List[Claim],
+        images: List[Dict[str, Any]]
+    ) -> List[Contradiction]:
+        """Phases 2 and 3 (or the fused call) for a set of unique claims."""
+        if self.fused_verification:
+            self._start_phase("verification")
+            print("[Phase 2+3] Verifying and detecting contradictions in one call...")
+            _, contradictions = self.phase_2_3_fused_verification(text, representatives, images)
+            return contradictions
+        
+        self._start_phase("verification")
         print("[Phase 2] Verifying against visual evidence...")
-        verifications = self.phase_2_visual_verification(text, claims, images)
+        verifications = self.phase_2_visual_verification(text, representatives, images)
         print(f"  → Completed visual verification")
         
+        # Early exit: nothing unsupported means nothing to contradict
+        if self._all_supported(verifications, representatives):
+            print("[Phase 3] Skipped: all claims supported")
+            return []
+        
+        self._start_phase("contradiction_detection")
         print("[Phase 3] Detecting contradictions...")
-        contradictions = self.phase_3_contradiction_detection(text, claims, verifications)
-        print(f"  → Found {len(contradictions)} contradictions")
+        return self.phase_3_contradiction_detection(text, representatives, verifications)
+    
+    @staticmethod
+    def _fan_out(
+        contradictions: List[Contradiction],
+        clusters: List[List[Claim]]
+    ) -> List[Contradiction]:
+        """
+        Copy each contradiction to every member of its claim's cluster.
+        Contradictions carry their representative's exact text (resolved from
+        the prompt claim_id by _parse_contradictions).
+        """
+        def _key(claim_text: str) -> str:
+            return " ".join(claim_text.split()).lower()
+        
+        cluster_by_text = {_key(cluster[0].text): cluster for cluster in clusters}
+        fanned_out: List[Contradiction] = []
+        for contradiction in contradictions:
+            cluster = cluster_by_text.get(_key(contradiction.claim))
+            if cluster is None:
+                fanned_out.append(contradiction)
+                continue
+            for member in cluster:
+                fanned_out.append(contradiction.model_copy(
+                    update={"claim": member.text, "claim_page": member.page}
+                ))
+        print(f"  → Found {len(fanned_out)} contradictions")
         
-        # Generate summary
+        return fanned_out
+    
+    def _stream_and_verify(
+        self,
+        text: str,
+        images: List[Dict[str, Any]]
+    ) -> Tuple[List[Claim], List[Contradiction]]:
+        """
+        Stream Phase 1 and overlap verification with it: unique claims are
+        grouped as they arrive, and each full group goes to Phases 2/3 on a
+        worker thread (and through the batcher, if enabled) while extraction
+        continues.
+        
+        Returns: (claims, contradictions)
+        """
+        request = self._request
+        request["overlapping_phases"] = True
+        clusterer = IncrementalClaimClusterer()
+        claims: List[Claim] = []
+        pending: List[Claim] = []
+        futures = []
+        
+        # One extra worker describes figures while Phase 1 streams
+        with ThreadPoolExecutor(max_workers=self.stream_verify_max_groups + 1) as pool:
+            pool.submit(self._run_with_request, request, self._figures_prompt_section, images)
+            
+            def _submit(group: List[Claim]) -> None:
+                print(f"[Phase 2] Verifying {len(group)} claim(s) while extraction continues...")
+                futures.append(pool.submit(
+                    self._run_with_request, request, self._verify_representatives, text, group, images
+                ))
+            
+            for claim in self.phase_1_stream_claims(text):
+                claims.append(claim)
+                is_new = clusterer.add(claim)
+                if not is_new or len(futures) >= self.stream_verify_max_groups:
+                    continue
+                pending.append(claim)
+                if len(pending) >= STREAM_VERIFY_GROUP_SIZE:
+                    _submit(pending)
+                    pending = []
+            
+            print(f"  → Found {len(claims)} claims")
+            if pending and len(futures) < self.stream_verify_max_groups:
+                _submit(pending)
+            
+            contradictions: List[Contradiction] = []
+            for future in futures:
+                contradictions += future.result()
+        
+        request["overlapping_phases"] = False
+        if len(clusterer.clusters) < len(claims):
+            print(f"  → Collapsed {len(claims)} claims into {len(clusterer.clusters)} unique claims")
+        return claims, self._fan_out(contradictions, clusterer.clusters)
+    
+    def _build_report(
+        self,
+        claims: List[Claim],
+        contradictions: List[Contradiction],
+        total_pages: int
+    ) -> AuditReport:
+        """Summarize phase results into an AuditReport."""
         summary = f"Analyzed {len(claims)} claims across {total_pages} pages. "
         summary += f"Detected {len(contradictions)} contradiction(s). "
         if contradictions:
@@ -350,3 +950,92 @@ If no contradictions found, return empty array: []
         )
         
         return report
+    
+    def run_incremental_audit(
+        self,
+        text: str,
+        images: List[Dict[str, Any]],
+        total_pages: int,
+        page_hashes: List[str],
+        previous_report: AuditReport,
+        governor: Optional[ResourceGovernor] = None
+    ) -> AuditReport:
+        """
+        Re-audit a revised paper, reusing results for pages that did not change.
+        
+        Pages are matched by content hash, so moved pages are still reused.
+        Claims on unchanged pages keep their prior verdicts; only changed pages
+        are re-extracted, and only their claims (plus reused claims whose visual
+        evidence page changed) go through verification.
+        """
+        self._begin_request(governor)
+        try:
+            report = self._run_incremental_audit(text, images, total_pages, page_hashes, previous_report)
+            report.figure_cache_stats = self._figure_cache_stats()
+            return report
+        finally:
+            self._end_request()
+    
+    def _run_incremental_audit(
+        self,
+        text: str,
+        images: List[Dict[str, Any]],
+        total_pages: int,
+        page_hashes: List[str],
+        previous_report: AuditReport
+    ) -> AuditReport:
+        old_hashes = previous_report.page_hashes or []
+        old_page_by_hash = {h: i + 1 for i, h in enumerate(old_hashes)}
+        # old page number -> new page number for unchanged pages
+        page_map = {
+            old_page_by_hash[h]: i + 1
+            for i, h in enumerate(page_hashes)
+            if h in old_page_by_hash
+        }
+        reused_pages = sorted(page_map.values())
+        # Pages past the governor's page budget have no hash and are not audited
+        changed_pages = [p for p in range(1, len(page_hashes) + 1) if p not in set(reused_pages)]
+        print(f"[Re-audit] {len(reused_pages)} unchanged page(s), {len(changed_pages)} changed page(s)")
+        
+        reused_claims: List[Claim] = []
+        for c in previous_report.claims:
+            if c.page in page_map:
+                reused_claims.append(c.model_copy(update={"page": page_map[c.page]}))
+        reused_texts = {c.text for c in reused_claims}
+        
+        reused_contradictions: List[Contradiction] = []
+        reverify_texts = set()
+        for c in previous_report.contradictions:
+            if c.claim not in reused_texts:
+                continue
+            if c.visual_evidence_page in page_map:
+                reused_contradictions.append(c.model_copy(update={
+                    "visual_evidence_page": page_map[c.visual_evidence_page],
+                    "claim_page": page_map.get(c.claim_page, c.claim_page),
+                }))
+            else:
+                reverify_texts.add(c.claim)
+        
+        new_claims: List[Claim] = []
+        if changed_pages:
+            changed_set = set(changed_pages)
+            changed_text = join_pages([(num, t) for num, t in split_pages(text) if num in changed_set])
+            self._start_phase("claim_extraction")
+            print("[Phase 1] Extracting claims from changed pages...")
+            new_claims = self.phase_1_extract_claims(changed_text)
+            print(f"  → Found {len(new_claims)} new claims")
+        else:
+            changed_text = ""
+        
+        to_verify = new_claims + [c for c in reused_claims if c.text in reverify_texts]
+        contradictions = list(reused_contradictions)
+        if to_verify:
+            print(f"[Re-audit] Verifying {len(to_verify)} claim(s)...")
+            contradictions += self._verify_claims(changed_text or text, to_verify, images)
+        else:
+            print("[Re-audit] No claims to verify; reusing previous results")
+        
+        report = self._build_report(reused_claims + new_claims, contradictions, total_pages)
+        report.reaudit_of = previous_report.report_id
+        report.reused_pages = reused_pages
+        return report
@@ -0,0 +1,153 @@
+"""
+Resource Governor
+Per-request budgets so a pathological PDF yields a partial report instead of
+exhausting a worker.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+
+class BudgetExceeded(Exception):
+    """Raised when a request runs out of one of its budgets."""
+
+    def __init__(self, budget: str, message: str):
+        super().__init__(message)
+        self.budget = budget
+
+
+class ResourceGovernor:
+    """Tracks one audit's usage against its budgets."""
+
+    def __init__(
+        self,
+        max_pages: int = 500,
+        max_images: int = 200,
+        max_text_chars: int = 2_000_000,
+        max_phase_seconds: float = 120.0,
+        max_model_tokens: int = 200_000
+    ):
+        self.max_pages = max_pages
+        self.max_images = max_images
+        self.max_text_chars = max_text_chars
+        self.max_phase_seconds = max_phase_seconds
+        self.max_model_tokens = max_model_tokens
+
+        self.pages = 0
+        self.images = 0
+        self.text_chars = 0
+        self.model_tokens = 0
+        self.model_calls = 0
+        self.phase_seconds: Dict[str, float] = {}
+        self.exceeded: List[str] = []
+        self._phase: Optional[str] = None
+        self._phase_start = 0.0
+        self._lock = threading.Lock()  # Model calls can record from worker threads
+
+    @classmethod
+    def from_env(cls) -> "ResourceGovernor":
+        """Budgets from AUDIT_MAX_* environment variables."""
+        return cls(
+            max_pages=int(os.getenv("AUDIT_MAX_PAGES", "500")),
+            max_images=int(os.getenv("AUDIT_MAX_IMAGES", "200")),
+            max_text_chars=int(os.getenv("AUDIT_MAX_TEXT_CHARS", "2000000")),
+            max_phase_seconds=float(os.getenv("AUDIT_MAX_PHASE_SECONDS", "120")),
+            max_model_tokens=int(os.getenv("AUDIT_MAX_MODEL_TOKENS", "200000")),
+        )
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.exceeded)
+
+    def _exceed(self, budget: str) -> None:
+        if budget not in self.exceeded:
+            self.exceeded.append(budget)
+            print(f"⚠️ Budget exceeded: {budget}; continuing with partial results")
+
+    # Phase timing
+
+    def start_phase(self, name: str) -> None:
+        self.end_phase()
+        self._phase = name
+        self._phase_start = time.time()
+
+    def end_phase(self) -> None:
+        if self._phase is not None:
+            self.phase_seconds[self._phase] = round(time.time() - self._phase_start, 2)
+            self._phase = None
+
+    def phase_seconds_left(self) -> Optional[float]:
+        """Wall-clock seconds left in the current phase (None outside a phase)."""
+        if self._phase is None:
+            return None
+        return max(0.0, self.max_phase_seconds - (time.time() - self._phase_start))
+
+    def phase_timed_out(self) -> BudgetExceeded:
+        """Record that a model call outlived the phase budget; returns the error to raise."""
+        self._exceed(f"phase_seconds:{self._phase}")
+        return BudgetExceeded("phase_seconds", f"Model call in phase '{self._phase}' exceeded {self.max_phase_seconds}s")
+
+    def phase_time_left(self) -> bool:
+        """False (and records it) once the current phase is over its wall-clock budget."""
+        if self._phase is None or time.time() - self._phase_start <= self.max_phase_seconds:
+            return True
+        self._exceed(f"phase_seconds:{self._phase}")
+        return False
+
+    # Ingestion budgets
+
+    def take_page(self) -> bool:
+        """Reserve one page; False once the page budget is used up."""
+        if self.pages >= self.max_pages:
+            self._exceed("pages")
+            return False
+        self.pages += 1
+        return True
+
+    def take_image(self) -> bool:
+        """Reserve one image; False once the image budget is used up."""
+        if self.images >= self.max_images:
+            self._exceed("images")
+            return False
+        self.images += 1
+        return True
+
+    def take_text(self, text: str) -> str:
+        """Account for extracted text, truncating it to what is left of the budget."""
+        remaining = self.max_text_chars - self.text_chars
+        if len(text) > remaining:
+            self._exceed("text_chars")
+            text = text[:max(0, remaining)]
+        self.text_chars += len(text)
+        return text
+
+    # Model budgets
+
+    def check_model_call(self, prompt_tokens: int) -> None:
+        """Raise BudgetExceeded if a call of this size would break a budget."""
+        if not self.phase_time_left():
+            raise BudgetExceeded("phase_seconds", f"Phase '{self._phase}' exceeded {self.max_phase_seconds}s")
+        if self.model_tokens + prompt_tokens > self.max_model_tokens:
+            self._exceed("model_tokens")
+            raise BudgetExceeded("model_tokens", f"Model token budget of {self.max_model_tokens} exhausted")
+
+    def record_model_call(self, tokens: int) -> None:
+        with self._lock:
+            self.model_calls += 1
+            self.model_tokens += tokens
+
+    def usage(self) -> Dict[str, Any]:
+        """Budget usage for the audit report."""
+        self.end_phase()
+        return {
+            "pages": {"used": self.pages, "limit": self.max_pages},
+            "images": {"used": self.images, "limit": self.max_images},
+            "text_chars": {"used": self.text_chars, "limit": self.max_text_chars},
+            "model_tokens": {"used": self.model_tokens, "limit": self.max_model_tokens},
+            "model_calls": self.model_calls,
+            "phase_seconds": dict(self.phase_seconds),
+            "max_phase_seconds": self.max_phase_seconds,
+            "exceeded": list(self.exceeded),
+        }
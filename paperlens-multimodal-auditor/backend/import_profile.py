@@ -0,0 +1,66 @@
+"""
+Import-Time Profiler
+Reports how long the backend's modules take to import in a fresh interpreter.
+
+Usage:
+    python import_profile.py          # profile `import main`
+    python import_profile.py --all    # also profile each heavy dependency
+    python import_profile.py --top 30
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+
+HEAVY_MODULES = ["fitz", "PIL.Image", "google.genai", "google.api_core.exceptions", "ingestion", "gemini_auditor"]
+
+
+def profile_import(module: str) -> List[Tuple[int, int, str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        List of (self_us, cumulative_us, module_name)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+        print(f"⚠️ import {module} failed: {error}")
+    return rows
+
+
+def print_report(module: str, top: int) -> None:
+    rows = profile_import(module)
+    if not rows:
+        return
+    total_us = max(cumulative for _, cumulative, _ in rows)
+    print(f"\nimport {module}: {total_us / 1000:.1f} ms total")
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile backend import time")
+    parser.add_argument("--all", action="store_true", help="Also profile each heavy dependency")
+    parser.add_argument("--top", type=int, default=15, help="Rows to show per report")
+    args = parser.parse_args()
+
+    print_report("main", args.top)
+    if args.all:
+        for module in HEAVY_MODULES:
+            print_report(module, args.top)
@@ -5,24 +5,55 @@ Extracts text and high-resolution images from PDFs.
 
 import fitz  # PyMuPDF
 import io
-from typing import Tuple, List
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Tuple, List, Dict, Any, Optional
 from PIL import Image
 import base64
+import numpy as np
+from governor import ResourceGovernor
 
 
-def extract_text_and_images(pdf_bytes: bytes) -> Tuple[dict, List[dict]]:
+# Vector figure rendering settings
+VECTOR_FIGURE_DPI = int(os.getenv("IMAGE_EXTRACTION_DPI", "150"))
+VECTOR_FIGURE_MAX_PIXELS = 2048  # Longest side of a rendered figure, in pixels
+VECTOR_FIGURE_MIN_SIZE = 72  # Minimum region width/height, in PDF points
+VECTOR_FIGURE_MIN_PATHS = 10  # Drawing paths needed without a caption
+VECTOR_FIGURE_MAX_DRAWINGS = int(os.getenv("VECTOR_FIGURE_MAX_DRAWINGS", "5000"))  # Skip denser pages
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_MB", "64")) * 1024 * 1024
+GRID_CELL_SIZE = 64  # PDF points; spatial index cell for clustering drawings
+
+CAPTION_PATTERN = re.compile(r"^\s*(fig\.?|figure)\s*\d+", re.IGNORECASE)
+
+# (page content key, bbox, dpi) -> PNG bytes; bounded by total size, not entries
+_render_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_render_cache_bytes = 0
+_render_cache_lock = threading.Lock()  # Audits run concurrently in the threadpool
+
+
+def extract_text_and_images(
+    pdf_bytes: bytes,
+    governor: Optional[ResourceGovernor] = None
+) -> Tuple[dict, List[dict]]:
     """
     Extract text and images from a PDF file.
     
     Args:
         pdf_bytes: Binary PDF data
+        governor: Optional per-request budgets; extraction stops early
+            (with the overrun recorded on the governor) instead of failing
         
     Returns:
         Tuple of:
-        - text_data: {"text": str, "pages": int}
-        - images: List of {"page": int, "image_b64": str, "image_pil": PIL.Image}
+        - text_data: {"text": str, "pages": int, "doc_hash": str, "page_hashes": List[str]}
+        - images: List of {"page": int, "image_b64": str, "image_pil": PIL.Image,
+          "source": "raster" | "vector", "phash": str}
     """
     
+    doc_hash = hashlib.sha256(pdf_bytes).hexdigest()
     pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
     if pdf_document.is_encrypted:
         # Try to authenticate with empty password (some PDFs use it)
@@ -33,22 +64,44 @@ def extract_text_and_images(pdf_bytes: bytes) -> Tuple[dict, List[dict]]:
             )
     total_pages = len(pdf_document)
     
-    # Extract all text
+    # Extract all text, hashing each page for incremental re-audits
     full_text = ""
+    page_hashes = []
+    image_digests: Dict[int, str] = {}  # xref -> stream digest, shared across pages
     for page_num in range(total_pages):
+        if governor is not None and not (governor.phase_time_left() and governor.take_page()):
+            break
         page = pdf_document[page_num]
+        page_text = page.get_text()
+        if governor is not None:
+            page_text = governor.take_text(page_text)
         full_text += f"\n--- PAGE {page_num + 1} ---\n"
-        full_text += page.get_text()
+        full_text += page_text
+        page_hashes.append(_hash_page(pdf_document, page, page_text, image_digests, governor))
+    
+    pages_read = len(page_hashes)
+    
+    def _image_budget_left() -> bool:
+        return governor is None or (governor.phase_time_left() and governor.take_image())
     
     # Extract images (high resolution)
     extracted_images = []
-    for page_num in range(total_pages):
+    images_exhausted = False
+    for page_num in range(pages_read):
+        if images_exhausted:
+            break
+        # Drawing extraction below is expensive; stop as soon as the phase is out of time
+        if governor is not None and not governor.phase_time_left():
+            break
         page = pdf_document[page_num]
         
         # Get all images on this page
         image_list = page.get_images(full=True)
         
         for img_index, img_ref in enumerate(image_list):
+            if not _image_budget_left():
+                images_exhausted = True
+                break
             xref = img_ref[0]
             pix = fitz.Pixmap(pdf_document, xref)
             
@@ -72,19 +125,311 @@ def extract_text_and_images(pdf_bytes: bytes) -> Tuple[dict, List[dict]]:
                 "image_index": img_index,
                 "image_b64": img_b64,
                 "image_pil": img,
-                "mime_type": "image/png"
+                "mime_type": "image/png",
+                "source": "raster",
+                "phash": perceptual_hash(img)
+            })
+        
+        if images_exhausted:
+            break
+        
+        # Vector figures (e.g. matplotlib plots) are not returned by get_images,
+        # so render just their clipped regions
+        raster_rects = []
+        for img_ref in image_list:
+            try:
+                raster_rects.extend(page.get_image_rects(img_ref[0]))
+            except Exception:
+                continue
+        
+        drawings = _read_drawings(page)
+        regions = _find_vector_figure_regions(page, drawings, governor)
+        # Page hash covers text and images; add the drawings so revised
+        # figures don't reuse stale renders, while unchanged pages still hit
+        content_key = _drawings_key(page_hashes[page_num], drawings) if regions else None
+        for fig_index, rect in enumerate(regions):
+            if any(rect.intersects(r) and (rect & r).get_area() > 0.5 * rect.get_area()
+                   for r in raster_rects):
+                continue  # Already covered by an embedded raster image
+            if not _image_budget_left():
+                images_exhausted = True
+                break
+            rendered = _render_clip(page, content_key, rect)
+            extracted_images.append({
+                "page": page_num + 1,
+                "image_index": len(image_list) + fig_index,
+                "image_b64": rendered["image_b64"],
+                "image_pil": rendered["image_pil"],
+                "mime_type": "image/png",
+                "source": "vector",
+                "bbox": [round(v, 1) for v in rect],
+                "phash": perceptual_hash(rendered["image_pil"])
             })
     
     pdf_document.close()
     
     text_data = {
         "text": full_text,
-        "pages": total_pages
+        "pages": total_pages,
+        "doc_hash": doc_hash,
+        "page_hashes": page_hashes
     }
     
     return text_data, extracted_images
 
 
+def perceptual_hash(img: Image.Image, hash_size: int = 8) -> str:
+    """
+    64-bit DCT perceptual hash (pHash) of an image, as 16 hex characters.
+    
+    Visually identical figures re-rendered at a different resolution or
+    re-compressed hash to the same or nearby values (small Hamming distance).
+    """
+    size = hash_size * 4
+    pixels = np.asarray(
+        img.convert("L").resize((size, size), Image.LANCZOS), dtype=np.float64
+    )
+    # 2D DCT-II via a DCT basis matrix (scaling does not affect the median test)
+    n = np.arange(size)
+    dct = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    coefficients = dct @ pixels @ dct.T
+    low_freq = coefficients[:hash_size, :hash_size].flatten()
+    bits = low_freq > np.median(low_freq[1:])  # Skip the DC term when thresholding
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return f"{value:0{hash_size * hash_size // 4}x}"
+
+
+def _hash_page(
+    pdf_document: "fitz.Document",
+    page: "fitz.Page",
+    page_text: str,
+    image_digests: Dict[int, str],
+    governor: Optional[ResourceGovernor] = None
+) -> str:
+    """
+    Hash a page's content: its text plus digests of its embedded images.
+    
+    Image xref numbers change between PDF exports, so the raw image streams
+    are hashed instead of the xrefs themselves. Digests are memoized per
+    xref in image_digests; once as many streams as the image budget allows
+    have been read, further images are identified by their stream metadata
+    (length and filter) instead of being read.
+    """
+    hasher = hashlib.sha256(page_text.encode("utf-8"))
+    page_digests = []
+    for img_ref in page.get_images(full=True):
+        xref = img_ref[0]
+        if xref not in image_digests:
+            image_digests[xref] = _image_stream_digest(
+                pdf_document, xref, read_stream=governor is None or len(image_digests) < governor.max_images
+            )
+        page_digests.append(image_digests[xref])
+    for digest in sorted(page_digests):
+        hasher.update(digest.encode("ascii"))
+    return hasher.hexdigest()
+
+
+def _image_stream_digest(pdf_document: "fitz.Document", xref: int, read_stream: bool) -> str:
+    try:
+        if read_stream:
+            return hashlib.sha256(pdf_document.xref_stream_raw(xref) or b"").hexdigest()
+        metadata = "|".join(
+            str(pdf_document.xref_get_key(xref, key)) for key in ("Length", "Filter", "Width", "Height")
+        )
+        return hashlib.sha256(metadata.encode("utf-8")).hexdigest()
+    except Exception:
+        return hashlib.sha256(b"").hexdigest()
+
+
+def _grid_cells(rect: "fitz.Rect") -> List[Tuple[int, int]]:
+    """Spatial index cells covered by a rectangle."""
+    return [
+        (x, y)
+        for x in range(int(rect.x0 // GRID_CELL_SIZE), int(rect.x1 // GRID_CELL_SIZE) + 1)
+        for y in range(int(rect.y0 // GRID_CELL_SIZE), int(rect.y1 // GRID_CELL_SIZE) + 1)
+    ]
+
+
+def _read_drawings(page: "fitz.Page") -> List[Dict[str, Any]]:
+    try:
+        return page.get_drawings()
+    except Exception as e:
+        print(f"⚠️ Could not read drawings on page {page.number + 1}: {e}")
+        return []
+
+
+def _drawings_key(page_hash: str, drawings: List[Dict[str, Any]]) -> str:
+    """Render cache key for a page: its content hash plus its vector drawings."""
+    hasher = hashlib.sha256(page_hash.encode("ascii"))
+    hasher.update(repr(drawings).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _find_vector_figure_regions(
+    page: "fitz.Page",
+    drawings: List[Dict[str, Any]],
+    governor: Optional[ResourceGovernor] = None
+) -> List["fitz.Rect"]:
+    """
+    Detect figure regions on a page from vector drawings and figure captions.
+    
+    Nearby drawing paths are merged into clusters. A cluster counts as a figure
+    if it is large enough and either has many paths or sits directly above a
+    "Figure N" / "Fig. N" caption, in which case the caption is included.
+    Pages with more than VECTOR_FIGURE_MAX_DRAWINGS paths are skipped, and
+    detection stops early if the governor's phase time runs out.
+    
+    Args:
+        page: PyMuPDF page
+        drawings: page.get_drawings() output
+        governor: Optional per-request budgets
+        
+    Returns:
+        List of clip rectangles in page coordinates
+    """
+    if not drawings:
+        return []
+    if len(drawings) > VECTOR_FIGURE_MAX_DRAWINGS:
+        print(f"⚠️ Page {page.number + 1} has {len(drawings)} drawing paths; skipping vector figure detection")
+        return []
+    
+    def _time_left() -> bool:
+        return governor is None or governor.phase_time_left()
+    
+    page_rect = page.rect
+    margin = 6  # points; joins axes, ticks and markers of the same plot
+    
+    def _grow(rect: "fitz.Rect") -> "fitz.Rect":
+        return fitz.Rect(rect.x0 - margin, rect.y0 - margin, rect.x1 + margin, rect.y1 + margin)
+    
+    # Greedy merge of path rectangles into clusters. A grid index keeps each
+    # lookup to the clusters near a path instead of every cluster on the page.
+    clusters: List[List[Any]] = []  # [rect, path_count, alive]
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    
+    def _index(cluster_id: int) -> None:
+        for cell in _grid_cells(clusters[cluster_id][0]):
+            ids = grid.setdefault(cell, [])
+            if cluster_id not in ids:
+                ids.append(cluster_id)
+    
+    def _neighbours(grown: "fitz.Rect") -> List[int]:
+        ids = {i for cell in _grid_cells(grown) for i in grid.get(cell, []) if clusters[i][2]}
+        return sorted(ids)
+    
+    for drawing_index, drawing in enumerate(drawings):
+        if drawing_index % 256 == 0 and not _time_left():
+            return []
+        r = fitz.Rect(drawing["rect"])
+        # Skip full-width rules (table borders, header lines)
+        if r.height < 2 and r.width > 0.8 * page_rect.width:
+            continue
+        # Hairlines have zero width or height; pad them so union and
+        # intersection don't treat them as empty rectangles
+        rect = fitz.Rect(r.x0 - 0.5, r.y0 - 0.5, r.x1 + 0.5, r.y1 + 0.5)
+        if not rect.intersects(page_rect):
+            continue
+        rect &= page_rect
+        grown = _grow(rect)
+        target = next((i for i in _neighbours(grown) if grown.intersects(clusters[i][0])), None)
+        if target is None:
+            clusters.append([fitz.Rect(rect), 1, True])
+            target = len(clusters) - 1
+        else:
+            clusters[target][0] |= rect
+            clusters[target][1] += 1
+        _index(target)
+    
+    # Clusters can grow into each other after merging; sweep until stable
+    changed = True
+    while changed:
+        if not _time_left():
+            return []
+        changed = False
+        for i, cluster in enumerate(clusters):
+            if not cluster[2]:
+                continue
+            for j in _neighbours(_grow(cluster[0])):
+                other = clusters[j]
+                if j == i or not _grow(cluster[0]).intersects(other[0]):
+                    continue
+                cluster[0] |= other[0]
+                cluster[1] += other[1]
+                other[2] = False
+                changed = True
+            _index(i)
+    clusters = [c for c in clusters if c[2]]
+    
+    captions = []
+    for block in page.get_text("blocks"):
+        if CAPTION_PATTERN.match(block[4] or ""):
+            captions.append(fitz.Rect(block[:4]))
+    
+    regions = []
+    for rect, path_count, _ in clusters:
+        if rect.width < VECTOR_FIGURE_MIN_SIZE or rect.height < VECTOR_FIGURE_MIN_SIZE:
+            continue
+        caption = next(
+            (c for c in captions
+             if 0 <= c.y0 - rect.y1 <= 40 and c.x0 < rect.x1 and c.x1 > rect.x0),
+            None,
+        )
+        if caption is None and path_count < VECTOR_FIGURE_MIN_PATHS:
+            continue
+        region = rect | caption if caption is not None else fitz.Rect(rect)
+        regions.append(region & page_rect)
+    
+    return regions
+
+
+def _render_clip(page: "fitz.Page", content_key: str, rect: "fitz.Rect") -> Dict[str, Any]:
+    """
+    Render a clipped page region at a bounded DPI, caching the PNG bytes.
+    
+    Only encoded PNGs are cached (bounded by RENDER_CACHE_MAX_MB in total);
+    every caller gets its own freshly decoded Image.
+    
+    Args:
+        page: PyMuPDF page
+        content_key: Hash of the page's content (see _drawings_key), so
+            unchanged pages of a revised upload still hit the cache
+        rect: Clip rectangle in page coordinates
+        
+    Returns:
+        {"image_b64": str, "image_pil": PIL.Image}
+    """
+    global _render_cache_bytes
+    
+    # Cap the DPI so the longest side stays within VECTOR_FIGURE_MAX_PIXELS
+    longest_side = max(rect.width, rect.height)
+    dpi = min(VECTOR_FIGURE_DPI, int(VECTOR_FIGURE_MAX_PIXELS * 72 / longest_side))
+    bbox = tuple(round(v, 1) for v in rect)
+    cache_key = (content_key, bbox, dpi)
+    
+    with _render_cache_lock:
+        png_bytes = _render_cache.get(cache_key)
+        if png_bytes is not None:
+            _render_cache.move_to_end(cache_key)
+    
+    if png_bytes is None:
+        pix = page.get_pixmap(clip=rect, dpi=dpi, alpha=False)
+        png_bytes = pix.tobytes("png")
+        with _render_cache_lock:
+            if cache_key not in _render_cache and len(png_bytes) <= RENDER_CACHE_MAX_BYTES:
+                _render_cache[cache_key] = png_bytes
+                _render_cache_bytes += len(png_bytes)
+                while _render_cache_bytes > RENDER_CACHE_MAX_BYTES:
+                    _, evicted = _render_cache.popitem(last=False)
+                    _render_cache_bytes -= len(evicted)
+    
+    return {
+        "image_b64": base64.b64encode(png_bytes).decode("utf-8"),
+        "image_pil": Image.open(io.BytesIO(png_bytes)),
+    }
+
+
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
     """
     Split extracted text into chunks with overlap.
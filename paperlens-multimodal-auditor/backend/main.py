@@ -4,23 +4,46 @@ Multimodal Contradiction Detector
 """
 
 import os
+import threading
 import time
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional, TYPE_CHECKING
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-from ingestion import extract_text_and_images
-from gemini_auditor import MultimodalAuditor
-from models import UploadResponse
+from normalization import normalize_text
+from models import AuditReport, UploadResponse
+from report_store import ReportStore
+from governor import ResourceGovernor
 import traceback
 
+# PyMuPDF, PIL and the Gemini SDK are imported on first use (see
+# _get_auditor and _run_audit_pipeline) so workers start quickly.
+# Run `python import_profile.py` to see what module import costs.
+if TYPE_CHECKING:
+    from gemini_auditor import MultimodalAuditor
+
 
 # Load environment variables
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Optional warm-up runs in the background so /health answers immediately
+    if os.getenv("WARMUP_ON_STARTUP", "false").lower() in ("1", "true", "yes"):
+        threading.Thread(target=_warm_up, daemon=True).start()
+    yield
+
+
 app = FastAPI(
     title="PaperLens",
     description="Multimodal Contradiction Detector using Gemini 3",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -40,13 +63,49 @@ async def log_requests(request, call_next):
     print(f"   ✅ Response: {response.status_code}")
     return response
 
-# Initialize auditor
-try:
-    auditor = MultimodalAuditor()
-    print("✅ Gemini 3 Auditor initialized successfully")
-except Exception as e:
-    print(f"❌ Failed to initialize auditor: {e}")
-    auditor = None
+# Auditor is constructed on first use
+auditor: Optional["MultimodalAuditor"] = None
+_auditor_lock = threading.Lock()
+_warming_up = False
+
+
+def _get_auditor() -> Optional["MultimodalAuditor"]:
+    """Return the shared auditor, creating it on first call; None if misconfigured."""
+    global auditor
+    if auditor is None:
+        with _auditor_lock:
+            if auditor is None:
+                try:
+                    from gemini_auditor import MultimodalAuditor
+                    auditor = MultimodalAuditor()
+                    print("✅ Gemini 3 Auditor initialized successfully")
+                except Exception as e:
+                    print(f"❌ Failed to initialize auditor: {e}")
+    return auditor
+
+
+def _warm_up() -> None:
+    """Preload heavy modules and the Gemini client ahead of the first audit."""
+    global _warming_up
+    _warming_up = True
+    try:
+        start = time.time()
+        import ingestion  # noqa: F401  (PyMuPDF + PIL)
+        current_auditor = _get_auditor()
+        if current_auditor is not None:
+            current_auditor.warm_up()
+        print(f"✅ Warm-up finished in {time.time() - start:.2f}s")
+    except Exception as e:
+        print(f"❌ Warm-up failed: {e}")
+    finally:
+        _warming_up = False
+
+
+report_store = ReportStore()
+
+# Background audit jobs, oldest first
+MAX_TRACKED_JOBS = 500
+audit_jobs: "OrderedDict[str, Dict]" = OrderedDict()
 
 
 @app.get("/health")
@@ -55,15 +114,127 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "PaperLens",
-        "gemini_ready": auditor is not None
+        "gemini_ready": auditor is not None and auditor.client_ready,
+        "warming_up": _warming_up,
+        "figure_cache": auditor.figure_cache.stats() if auditor is not None else None,
+        "models": auditor.router.snapshot() if auditor is not None else None
     }
 
 
+def _validate_upload(file: UploadFile, pdf_bytes: bytes) -> None:
+    """Reject uploads that are empty or clearly not PDFs."""
+    print(
+        f"📄 Processing PDF: {file.filename} ({len(pdf_bytes)} bytes, "
+        f"content_type={file.content_type})"
+    )
+    
+    # Basic PDF validation (extension OR PDF header)
+    is_pdf_extension = file.filename.lower().endswith(".pdf") if file.filename else False
+    has_pdf_header = pdf_bytes[:4] == b"%PDF"
+    is_pdf_mime = (file.content_type or "").lower() == "application/pdf"
+    print(
+        f"🔎 PDF validation: extension={is_pdf_extension}, header={has_pdf_header}, "
+        f"mime={is_pdf_mime}"
+    )
+    print(f"🔎 PDF header bytes: {pdf_bytes[:8]!r}")
+    
+    if not (is_pdf_extension or has_pdf_header or is_pdf_mime):
+        print(f"❌ PDF validation FAILED")
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "File rejected: not a valid PDF. Please upload a .pdf file "
+                "or ensure the file starts with %PDF."
+            )
+        )
+    
+    if len(pdf_bytes) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Uploaded file is empty. Please upload a valid PDF."
+        )
+
+
+def _load_previous_report(previous_report_id: Optional[str]) -> Optional[AuditReport]:
+    """Look up the report to diff against for an incremental re-audit."""
+    if not previous_report_id:
+        return None
+    previous_report = report_store.get(previous_report_id)
+    if previous_report is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Previous report not found: {previous_report_id}"
+        )
+    return previous_report
+
+
+def _run_audit_pipeline(
+    pdf_bytes: bytes,
+    previous_report: Optional[AuditReport] = None,
+    on_stage: Callable[[str], None] = lambda stage: None
+) -> AuditReport:
+    """
+    Ingest, normalize and audit a PDF, then persist the report.
+    
+    Blocking; run it in the threadpool or a background task.
+    """
+    from ingestion import extract_text_and_images
+    
+    start_time = time.time()
+    governor = ResourceGovernor.from_env()
+    
+    # Phase 0: Ingest PDF
+    on_stage("ingesting")
+    governor.start_phase("ingestion")
+    print("[Ingestion] Extracting text and images...")
+    text_data, images = extract_text_and_images(pdf_bytes, governor)
+    total_pages = text_data["pages"]
+    full_text = text_data["text"]
+    print(f"  → Extracted {len(full_text)} characters, {len(images)} images")
+    
+    # Strip headers/footers, line numbers and references before prompting
+    on_stage("normalizing")
+    governor.start_phase("normalization")
+    print("[Normalization] Cleaning extracted text...")
+    full_text, normalization_stats = normalize_text(full_text)
+    print(
+        f"  → {normalization_stats['tokens_before']} → {normalization_stats['tokens_after']} "
+        f"est. tokens ({normalization_stats['percent_saved']}% saved)"
+    )
+    
+    on_stage("auditing")
+    auditor = _get_auditor()
+    if previous_report is not None:
+        audit_report = auditor.run_incremental_audit(
+            full_text, images, total_pages, text_data["page_hashes"], previous_report, governor
+        )
+    else:
+        audit_report = auditor.run_full_audit(full_text, images, total_pages, governor)
+    audit_report.processing_time_seconds = time.time() - start_time
+    audit_report.normalization_stats = normalization_stats
+    audit_report.page_hashes = text_data["page_hashes"]
+    audit_report.budget_usage = governor.usage()
+    if governor.partial:
+        audit_report.partial = True
+        audit_report.audit_summary += (
+            f" Partial audit: resource budget exceeded ({', '.join(governor.exceeded)})."
+        )
+    report_store.save(audit_report)
+    
+    return audit_report
+
+
 @app.post("/api/audit")
-async def upload_and_audit(file: UploadFile = File(...)):
+async def upload_and_audit(
+    file: UploadFile = File(...),
+    previous_report_id: Optional[str] = Form(None)
+):
     """
     Upload a PDF and run the full contradiction detection pipeline.
     
+    If previous_report_id is given, only pages that changed since that
+    report are re-extracted and re-verified.
+    
     Returns:
         UploadResponse with audit report or error details
     """
@@ -72,58 +243,21 @@ async def upload_and_audit(file: UploadFile = File(...)):
     print(f"📨 INCOMING REQUEST TO /api/audit")
     print(f"{'='*70}")
     
-    if auditor is None:
+    if _get_auditor() is None:
         raise HTTPException(
             status_code=500,
             detail="Gemini 3 API not initialized. Check GOOGLE_API_KEY."
         )
     
     try:
-        start_time = time.time()
-        
         # Read PDF bytes
         pdf_bytes = await file.read()
-        print(
-            f"📄 Processing PDF: {file.filename} ({len(pdf_bytes)} bytes, "
-            f"content_type={file.content_type})"
-        )
+        _validate_upload(file, pdf_bytes)
+        previous_report = _load_previous_report(previous_report_id)
         
-        # Basic PDF validation (extension OR PDF header)
-        is_pdf_extension = file.filename.lower().endswith(".pdf") if file.filename else False
-        has_pdf_header = pdf_bytes[:4] == b"%PDF"
-        is_pdf_mime = (file.content_type or "").lower() == "application/pdf"
-        print(
-            f"🔎 PDF validation: extension={is_pdf_extension}, header={has_pdf_header}, "
-            f"mime={is_pdf_mime}"
-        )
-        print(f"🔎 PDF header bytes: {pdf_bytes[:8]!r}")
-        
-        if not (is_pdf_extension or has_pdf_header or is_pdf_mime):
-            print(f"❌ PDF validation FAILED")
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    "File rejected: not a valid PDF. Please upload a .pdf file "
-                    "or ensure the file starts with %PDF."
-                )
-            )
-        
-        if len(pdf_bytes) == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Uploaded file is empty. Please upload a valid PDF."
-            )
-        
-        # Phase 0: Ingest PDF
-        print("[Ingestion] Extracting text and images...")
-        text_data, images = extract_text_and_images(pdf_bytes)
-        total_pages = text_data["pages"]
-        full_text = text_data["text"]
-        print(f"  → Extracted {len(full_text)} characters, {len(images)} images")
-        
-        # Run audit pipeline
-        audit_report = auditor.run_full_audit(full_text, images, total_pages)
-        audit_report.processing_time_seconds = time.time() - start_time
+        # Run the pipeline off the event loop so concurrent audits overlap
+        # (and can share batched Gemini calls)
+        audit_report = await run_in_threadpool(_run_audit_pipeline, pdf_bytes, previous_report)
         
         return UploadResponse(
             status="success",
@@ -143,6 +277,86 @@ async def upload_and_audit(file: UploadFile = File(...)):
         )
 
 
+def _run_audit_job(job_id: str, pdf_bytes: bytes, previous_report: Optional[AuditReport]) -> None:
+    """Background task body for /api/audit/jobs."""
+    job = audit_jobs.get(job_id, {})  # May have been evicted; still run the audit
+    
+    def _set_stage(stage: str) -> None:
+        job["stage"] = stage
+    
+    try:
+        audit_report = _run_audit_pipeline(pdf_bytes, previous_report, _set_stage)
+        job["report_id"] = audit_report.report_id
+        job["stage"] = "complete"
+        job["status"] = "complete"
+    except Exception as e:
+        print(f"❌ Error during audit job {job_id}: {e}")
+        traceback.print_exc()
+        job["status"] = "failed"
+        job["error"] = str(e)
+
+
+@app.post("/api/audit/jobs", status_code=202)
+async def submit_audit_job(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    previous_report_id: Optional[str] = Form(None)
+):
+    """
+    Upload a PDF and start the audit in the background.
+    
+    Returns immediately with a job id; poll GET /api/audit/jobs/{job_id}
+    and fetch the result from GET /api/reports/{report_id}.
+    """
+    if _get_auditor() is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Gemini 3 API not initialized. Check GOOGLE_API_KEY."
+        )
+    
+    pdf_bytes = await file.read()
+    _validate_upload(file, pdf_bytes)
+    previous_report = _load_previous_report(previous_report_id)
+    
+    job_id = uuid.uuid4().hex
+    audit_jobs[job_id] = {
+        "job_id": job_id,
+        "status": "running",
+        "stage": "queued",
+        "filename": file.filename,
+        "submitted_at": time.time(),
+        "report_id": None,
+        "error": None,
+    }
+    while len(audit_jobs) > MAX_TRACKED_JOBS:
+        audit_jobs.popitem(last=False)
+    
+    background_tasks.add_task(_run_audit_job, job_id, pdf_bytes, previous_report)
+    return audit_jobs[job_id]
+
+
+@app.get("/api/audit/jobs/{job_id}")
+async def get_audit_job(job_id: str):
+    """Status of a background audit job."""
+    job = audit_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return {**job, "elapsed_seconds": time.time() - job["submitted_at"]}
+
+
+@app.get("/api/reports/{report_id}")
+async def get_report(report_id: str):
+    """Fetch a stored audit report."""
+    report = report_store.get(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail=f"Report not found: {report_id}")
+    return UploadResponse(
+        status="success",
+        message=f"Audit completed in {report.processing_time_seconds:.1f}s",
+        audit_report=report
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API documentation."""
@@ -151,7 +365,11 @@ async def root():
         "description": "Multimodal Contradiction Detector using Gemini 3",
         "endpoints": {
             "GET /health": "Health check",
-            "POST /api/audit": "Upload PDF and run contradiction detection"
+            "POST /api/audit": "Upload PDF and run contradiction detection "
+                               "(optional previous_report_id form field for incremental re-audit)",
+            "POST /api/audit/jobs": "Upload PDF and start the audit in the background",
+            "GET /api/audit/jobs/{job_id}": "Poll a background audit job",
+            "GET /api/reports/{report_id}": "Fetch a stored audit report"
         },
         "docs": "/docs"
     }
@@ -0,0 +1,176 @@
+"""
+Model Router
+Per-phase model selection with rolling latency/error tracking and fallback.
+"""
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+
+WINDOW_SIZE = 50  # Calls kept per model for rolling stats
+MIN_SAMPLES = 5  # Calls needed before a model's latency is trusted
+MAX_ERROR_RATE = 0.5  # Above this (within the cooldown) a model is unhealthy
+COOLDOWN_SECONDS = 30.0  # How long an unhealthy model is avoided after its last failure
+EXPLORE_RATE = 0.05  # Share of calls sent to the least-sampled model to learn its latency
+FUSED_PHASE = "2+3"  # Phases 2 and 3 in a single call (GEMINI_FUSED_VERIFICATION)
+
+Phase = Union[int, str]
+
+
+def _parse_mapping(value: str) -> Dict[str, str]:
+    """Parse "a:1,b:2" into {"a": "1", "b": "2"}."""
+    mapping = {}
+    for item in value.split(","):
+        if ":" in item:
+            key, val = item.rsplit(":", 1)
+            mapping[key.strip()] = val.strip()
+    return mapping
+
+
+class ModelStats:
+    """Rolling latency and outcome window for one model."""
+
+    def __init__(self):
+        self.latencies = deque(maxlen=WINDOW_SIZE)
+        self.outcomes = deque(maxlen=WINDOW_SIZE)  # True = success
+        self.last_failure = 0.0
+
+    def p95(self) -> Optional[float]:
+        if len(self.latencies) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    def healthy(self) -> bool:
+        if len(self.outcomes) < MIN_SAMPLES or self.error_rate() < MAX_ERROR_RATE:
+            return True
+        # Give it another chance once the cooldown has passed
+        return time.time() - self.last_failure >= COOLDOWN_SECONDS
+
+
+class ModelRouter:
+    """
+    Routes each phase to the fastest healthy model that meets its quality tier.
+
+    Every model has a tier (higher = more capable) and every phase a minimum
+    tier. The phase's configured model is tried first until there is enough
+    latency data; after that, healthy eligible models are ordered by rolling
+    p95 latency and unhealthy ones are only used as a last resort. A small
+    share of calls probes the least-sampled eligible model so alternatives
+    have latency data when the preferred one degrades.
+
+    Latency is tracked per (model, phase, kind) so long Phase 1 prompts,
+    image calls ("image") and whole-stream durations ("stream") don't make a
+    model look slow for other work. Health (error rate) is tracked per model.
+    """
+
+    def __init__(
+        self,
+        model_tiers: Dict[str, int],
+        phase_models: Dict[int, str],
+        phase_min_tiers: Dict[int, int]
+    ):
+        self.model_tiers = dict(model_tiers)
+        for model in phase_models.values():
+            self.model_tiers.setdefault(model, max(self.model_tiers.values(), default=1))
+        self.phase_models = phase_models
+        self.phase_min_tiers = phase_min_tiers
+        self._health: Dict[str, ModelStats] = {m: ModelStats() for m in self.model_tiers}
+        self._latency: Dict[Tuple[str, Phase, str], ModelStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default_model: str) -> "ModelRouter":
+        """
+        Configure from environment variables:
+            GEMINI_MODEL_TIERS="gemini-2.0-flash-lite:1,gemini-2.0-flash:2"
+            GEMINI_MODEL_PHASE_1=gemini-2.0-flash-lite  (also _2, _3)
+            GEMINI_PHASE_MIN_TIERS="1:1,2:2,3:2"
+        """
+        model_tiers = {
+            model: int(tier)
+            for model, tier in _parse_mapping(os.getenv("GEMINI_MODEL_TIERS", "")).items()
+        }
+        phase_models = {
+            phase: os.getenv(f"GEMINI_MODEL_PHASE_{phase}", default_model) for phase in (1, 2, 3)
+        }
+        phase_min_tiers = {
+            int(phase): int(tier)
+            for phase, tier in _parse_mapping(os.getenv("GEMINI_PHASE_MIN_TIERS", "")).items()
+        }
+        return cls(model_tiers, phase_models, phase_min_tiers)
+
+    def _phase_config(self, phase: Phase) -> Tuple[Optional[str], int]:
+        """Preferred model and minimum tier for a phase."""
+        if phase == FUSED_PHASE:
+            # The fused call does Phase 3's reasoning too: use the stronger
+            # configured model (Phase 3 on ties) and the higher minimum tier
+            models = [m for m in (self.phase_models.get(3), self.phase_models.get(2)) if m]
+            preferred = max(models, key=lambda m: self.model_tiers[m]) if models else None
+            return preferred, max(self.phase_min_tiers.get(2, 0), self.phase_min_tiers.get(3, 0))
+        return self.phase_models.get(phase), self.phase_min_tiers.get(phase, 0)
+
+    def _workload(self, model: str, phase: Phase, kind: str) -> ModelStats:
+        return self._latency.setdefault((model, phase, kind), ModelStats())
+
+    def candidates(self, phase: Phase, kind: str = "text") -> List[str]:
+        """Models eligible for a phase, best first."""
+        preferred, min_tier = self._phase_config(phase)
+        if preferred is not None:
+            # The configured model always qualifies for its own phase
+            min_tier = min(min_tier, self.model_tiers[preferred])
+        eligible = [m for m, tier in self.model_tiers.items() if tier >= min_tier]
+
+        with self._lock:
+            def rank(model: str):
+                p95 = self._workload(model, phase, kind).p95()
+                if p95 is None:
+                    # Untested: configured model first, others only as fallback
+                    p95 = 0.0 if model == preferred else float("inf")
+                return (not self._health[model].healthy(), p95, model != preferred)
+
+            ordered = sorted(eligible, key=rank)
+            if len(ordered) > 1 and random.random() < EXPLORE_RATE:
+                probe = min(ordered, key=lambda m: len(self._workload(m, phase, kind).latencies))
+                if self._health[probe].healthy():
+                    ordered.remove(probe)
+                    ordered.insert(0, probe)
+            return ordered
+
+    def record(self, model: str, latency: float, ok: bool, phase: Phase, kind: str = "text") -> None:
+        """Record the outcome of one call."""
+        with self._lock:
+            health = self._health.setdefault(model, ModelStats())
+            health.outcomes.append(ok)
+            if ok:
+                self._workload(model, phase, kind).latencies.append(latency)
+            else:
+                health.last_failure = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-model rolling stats for monitoring."""
+        with self._lock:
+            snapshot = {
+                model: {
+                    "tier": self.model_tiers.get(model),
+                    "calls": len(health.outcomes),
+                    "error_rate": round(health.error_rate(), 3),
+                    "healthy": health.healthy(),
+                    "p95_seconds": {},
+                }
+                for model, health in self._health.items()
+            }
+            for (model, phase, kind), stats in self._latency.items():
+                p95 = stats.p95()
+                if p95 is not None:
+                    snapshot[model]["p95_seconds"][f"{phase}/{kind}"] = round(p95, 3)
+            return snapshot
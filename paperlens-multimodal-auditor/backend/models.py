@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 
 
 class Claim(BaseModel):
@@ -18,6 +18,7 @@ class Contradiction(BaseModel):
     contradiction_type: str  # "direct_conflict", "partial_contradiction", "unsupported"
     confidence: float = Field(..., ge=0.0, le=1.0)
     reasoning: Optional[str] = None
+    claim_page: Optional[int] = None  # Page of the claim (set when fanned out from a duplicate cluster)
 
 
 class AuditReport(BaseModel):
@@ -28,6 +29,14 @@ class AuditReport(BaseModel):
     total_pages: int
     processing_time_seconds: float
     gemini_reasoning_trace: Optional[str] = None
+    normalization_stats: Optional[Dict[str, Any]] = None  # Token savings from text normalization
+    report_id: Optional[str] = None
+    page_hashes: Optional[List[str]] = None  # Per-page content hashes for incremental re-audits
+    reaudit_of: Optional[str] = None  # Report id this audit was diffed against
+    reused_pages: Optional[List[int]] = None  # Pages whose results were reused from reaudit_of
+    partial: bool = False  # True if a resource budget was hit and results are incomplete
+    budget_usage: Optional[Dict[str, Any]] = None  # Per-request resource usage vs. limits
+    figure_cache_stats: Optional[Dict[str, Any]] = None  # Perceptual-hash figure cache hits for this audit
 
 
 class UploadResponse(BaseModel):
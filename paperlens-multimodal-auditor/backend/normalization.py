@@ -0,0 +1,238 @@
+"""
+Text Normalization Module
+Strips boilerplate from extracted PDF text before it is sent to Gemini.
+"""
+
+import re
+from collections import Counter
+from typing import Tuple, List, Dict, Any
+
+
+PAGE_MARKER_PATTERN = re.compile(r"\n--- PAGE (\d+) ---\n")
+REFERENCES_HEADING_PATTERN = re.compile(
+    r"^\s*(\d+\.?\s*)?(references|bibliography|works cited)\s*$", re.IGNORECASE
+)
+APPENDIX_HEADING_PATTERN = re.compile(
+    r"^\s*([A-Z]\.?\s*)?(appendix|appendices|supplementary material)\b", re.IGNORECASE
+)
+LINE_NUMBER_PATTERN = re.compile(r"^\s*\d{1,4}\s*$")
+HYPHEN_BREAK_PATTERN = re.compile(r"([A-Za-z-]*[a-z])-\n\s*([a-z]+)")
+
+# Line-broken hyphens are kept (not merged) around these words
+COMPOUND_FIRST_WORDS = {
+    "cross", "few", "fine", "high", "large", "long", "low", "multi", "non",
+    "real", "self", "semi", "short", "small", "state", "well", "zero",
+}
+COMPOUND_SECOND_WORDS = {
+    "art", "aware", "based", "dependent", "driven", "end", "free", "grained",
+    "independent", "known", "level", "like", "of", "off", "order", "scale",
+    "shot", "specific", "term", "the", "time", "trained", "tuned", "wise",
+}
+
+CHARS_PER_TOKEN = 4  # Rough estimate for English prose
+MIN_PAGES_FOR_REPEATS = 3
+REPEAT_PAGE_FRACTION = 0.5  # Line must appear on at least this share of pages
+MAX_REPEATED_LINE_LENGTH = 120
+HEADER_FOOTER_LINES = 3  # Lines at the top and bottom of a page that may be headers/footers
+MIN_REPEATED_LINE_WORDS = 2  # Single words ("Method", "Ours") are table labels, not headers
+MIN_LINE_NUMBER_RUN = 10
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of a string."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_pages(text: str) -> List[Tuple[int, str]]:
+    """
+    Split ingested text on its "--- PAGE N ---" markers.
+
+    Returns:
+        List of (page_number, page_text)
+    """
+    parts = PAGE_MARKER_PATTERN.split(text)
+    # parts = [preamble, num1, text1, num2, text2, ...]
+    return [(int(parts[i]), parts[i + 1]) for i in range(1, len(parts) - 1, 2)]
+
+
+def join_pages(pages: List[Tuple[int, str]]) -> str:
+    """Inverse of split_pages."""
+    return "".join(f"\n--- PAGE {num} ---\n{page_text}" for num, page_text in pages)
+
+
+def _line_signature(line: str) -> str:
+    # Page numbers inside headers/footers change per page ("Page 3 of 12")
+    return re.sub(r"\d+", "#", " ".join(line.split()).lower())
+
+
+def _edge_line_indices(lines: List[str]) -> List[int]:
+    """Indices of the first and last few non-empty lines of a page."""
+    non_empty = [i for i, line in enumerate(lines) if line.strip()]
+    return sorted(set(non_empty[:HEADER_FOOTER_LINES] + non_empty[-HEADER_FOOTER_LINES:]))
+
+
+def _is_header_candidate(line: str) -> bool:
+    """Numbers and short labels (e.g. table cells) are never treated as headers."""
+    stripped = line.strip()
+    if not stripped or len(stripped) > MAX_REPEATED_LINE_LENGTH:
+        return False
+    if not re.search(r"[A-Za-z]", stripped):
+        return False
+    return len(stripped.split()) >= MIN_REPEATED_LINE_WORDS
+
+
+def _find_repeated_lines(pages: List[Tuple[int, str]]) -> set:
+    """Find header/footer lines that repeat at the top or bottom of many pages."""
+    if len(pages) < MIN_PAGES_FOR_REPEATS:
+        return set()
+
+    page_counts: Counter = Counter()
+    for _, page_text in pages:
+        lines = page_text.splitlines()
+        signatures = {
+            _line_signature(lines[i])
+            for i in _edge_line_indices(lines)
+            if _is_header_candidate(lines[i])
+        }
+        page_counts.update(signatures)
+
+    threshold = max(MIN_PAGES_FOR_REPEATS, int(len(pages) * REPEAT_PAGE_FRACTION))
+    return {sig for sig, count in page_counts.items() if count >= threshold}
+
+
+def _strip_repeated_lines(lines: List[str], repeated: set) -> List[str]:
+    """Drop repeated header/footer lines from the top and bottom of a page only."""
+    edges = set(_edge_line_indices(lines))
+    return [
+        line for i, line in enumerate(lines)
+        if i not in edges or _line_signature(line) not in repeated
+    ]
+
+
+def _strip_line_numbers(lines: List[str]) -> Tuple[List[str], int]:
+    """
+    Drop margin line-number columns: runs of bare integers that each
+    increase by exactly 1. Other numeric lines (e.g. table columns) are kept.
+    """
+    numeric = [(i, int(line)) for i, line in enumerate(lines) if LINE_NUMBER_PATTERN.match(line)]
+
+    drop = set()
+    run = numeric[:1]
+    for item in numeric[1:] + [None]:
+        if item is not None and item[1] == run[-1][1] + 1:
+            run.append(item)
+            continue
+        if len(run) >= MIN_LINE_NUMBER_RUN:
+            drop.update(i for i, _ in run)
+        run = [item]
+
+    kept = [line for i, line in enumerate(lines) if i not in drop]
+    return kept, len(drop)
+
+
+def _merge_hyphenation(match: "re.Match") -> str:
+    """Join a word split across lines, keeping the hyphen of compound words."""
+    first, second = match.group(1), match.group(2)
+    last_part = first.rsplit("-", 1)[-1].lower()
+    if "-" in first or last_part in COMPOUND_FIRST_WORDS or second in COMPOUND_SECOND_WORDS:
+        return f"{first}-{second}"
+    return first + second
+
+
+def _drop_references(pages: List[Tuple[int, str]]) -> Tuple[List[Tuple[int, str]], bool]:
+    """Remove the references section, keeping any appendix that follows it."""
+    # Only look in the second half of the paper to avoid tables of contents
+    start_index = len(pages) // 2
+    for page_index in range(len(pages) - 1, start_index - 1, -1):
+        num, page_text = pages[page_index]
+        lines = page_text.splitlines()
+        for line_index in range(len(lines) - 1, -1, -1):
+            if not REFERENCES_HEADING_PATTERN.match(lines[line_index]):
+                continue
+
+            result = pages[:page_index]
+            result.append((num, "\n".join(lines[:line_index]) + "\n"))
+
+            # Resume at the first appendix heading after the references
+            tail = [(num, "\n".join(lines[line_index + 1:]))] + pages[page_index + 1:]
+            for tail_index, (tail_num, tail_text) in enumerate(tail):
+                tail_lines = tail_text.splitlines()
+                for k, tail_line in enumerate(tail_lines):
+                    if APPENDIX_HEADING_PATTERN.match(tail_line):
+                        kept = "\n".join(tail_lines[k:]) + "\n"
+                        if tail_num == num:
+                            result[-1] = (num, result[-1][1] + kept)
+                        else:
+                            result.append((tail_num, kept))
+                        result.extend(tail[tail_index + 1:])
+                        return result, True
+                if tail_index > 0:
+                    result.append((tail_num, ""))  # Keep page markers intact
+            return result, True
+
+    return pages, False
+
+
+def normalize_text(text: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Remove token-wasting noise from ingested text.
+
+    Strips running headers/footers and line-number columns, merges
+    hyphenated line breaks, collapses whitespace and drops the references
+    section. Page markers are preserved.
+
+    Args:
+        text: Output text from extract_text_and_images
+
+    Returns:
+        Tuple of:
+        - normalized_text: str
+        - stats: Before/after character and token counts plus per-step counters
+    """
+    pages = split_pages(text)
+    if not pages:
+        pages = [(1, text)]
+
+    repeated = _find_repeated_lines(pages)
+    repeated_removed = 0
+    line_numbers_removed = 0
+    hyphenations_merged = 0
+
+    cleaned_pages = []
+    for num, page_text in pages:
+        lines = page_text.splitlines()
+
+        kept = _strip_repeated_lines(lines, repeated)
+        repeated_removed += len(lines) - len(kept)
+
+        kept, removed = _strip_line_numbers(kept)
+        line_numbers_removed += removed
+
+        page_text = "\n".join(kept)
+        page_text, merged = HYPHEN_BREAK_PATTERN.subn(_merge_hyphenation, page_text)
+        hyphenations_merged += merged
+
+        page_text = re.sub(r"[ \t ]+", " ", page_text)
+        page_text = re.sub(r" *\n *", "\n", page_text)
+        page_text = re.sub(r"\n{3,}", "\n\n", page_text).strip()
+        cleaned_pages.append((num, page_text + "\n"))
+
+    cleaned_pages, references_dropped = _drop_references(cleaned_pages)
+    normalized = join_pages(cleaned_pages)
+
+    tokens_before = estimate_tokens(text)
+    tokens_after = estimate_tokens(normalized)
+    stats = {
+        "chars_before": len(text),
+        "chars_after": len(normalized),
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "tokens_saved": tokens_before - tokens_after,
+        "percent_saved": round(100 * (tokens_before - tokens_after) / tokens_before, 1) if tokens_before else 0.0,
+        "repeated_lines_removed": repeated_removed,
+        "line_numbers_removed": line_numbers_removed,
+        "hyphenations_merged": hyphenations_merged,
+        "references_dropped": references_dropped,
+    }
+
+    return normalized, stats
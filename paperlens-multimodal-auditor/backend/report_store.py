@@ -0,0 +1,64 @@
+"""
+Report Store
+Persists audit reports on disk so revised uploads can be re-audited incrementally.
+"""
+
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional
+from models import AuditReport
+
+
+REPORT_STORE_DIR = os.getenv("REPORT_STORE_DIR", os.path.join(os.path.dirname(__file__), "reports"))
+REPORT_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+REPORT_CACHE_MAX_ENTRIES = 128
+
+
+class ReportStore:
+    """JSON-file report store with a bounded in-memory LRU cache."""
+
+    def __init__(self, directory: str = REPORT_STORE_DIR, max_cached: int = REPORT_CACHE_MAX_ENTRIES):
+        self.directory = directory
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, AuditReport]" = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _remember(self, report_id: str, report: AuditReport) -> None:
+        with self._lock:
+            self._cache[report_id] = report
+            self._cache.move_to_end(report_id)
+            if len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+    def _path(self, report_id: str) -> str:
+        return os.path.join(self.directory, f"{report_id}.json")
+
+    def save(self, report: AuditReport) -> str:
+        """Assign a report id (if missing), persist the report and return the id."""
+        if not report.report_id:
+            report.report_id = uuid.uuid4().hex
+        with open(self._path(report.report_id), "w", encoding="utf-8") as f:
+            f.write(report.model_dump_json())
+        self._remember(report.report_id, report)
+        return report.report_id
+
+    def get(self, report_id: str) -> Optional[AuditReport]:
+        """Load a report by id, or None if it does not exist."""
+        if not REPORT_ID_PATTERN.match(report_id or ""):
+            return None
+        with self._lock:
+            cached = self._cache.get(report_id)
+            if cached is not None:
+                self._cache.move_to_end(report_id)
+                return cached
+        path = self._path(report_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            report = AuditReport.model_validate_json(f.read())
+        self._remember(report_id, report)
+        return report
@@ -0,0 +1,80 @@
+"""
+Streaming JSON Parser
+Emits the objects of a JSON array as soon as each one closes.
+"""
+
+import json
+from typing import Dict, Any, List
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser for a streamed top-level JSON array of objects.
+
+    Text before the opening "[" (e.g. a ```json fence) is ignored, as is
+    anything after the closing "]". Objects that fail to parse are skipped.
+
+    Usage:
+        parser = JSONArrayStreamParser()
+        for piece in stream:
+            for obj in parser.feed(piece):
+                ...
+    """
+
+    def __init__(self):
+        self._started = False
+        self._finished = False
+        self._depth = 0  # Nesting depth; 1 = inside the top-level array
+        self._in_string = False
+        self._escape = False
+        self._buffer: List[str] = []  # Characters of the object being read
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume the next piece of the stream; return any objects it completed."""
+        completed = []
+        for ch in text:
+            if self._finished:
+                break
+            if not self._started:
+                if ch == "[":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            capturing = self._depth >= 2
+            if capturing:
+                self._buffer.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 2:
+                    self._buffer = [ch]
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 1 and capturing:
+                    obj = self._parse("".join(self._buffer))
+                    if obj is not None:
+                        completed.append(obj)
+                    self._buffer = []
+                elif self._depth == 0:
+                    self._finished = True
+        return completed
+
+    @staticmethod
+    def _parse(raw: str):
+        try:
+            obj = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        return obj if isinstance(obj, dict) else None
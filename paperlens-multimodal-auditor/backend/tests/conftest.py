@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Backend modules are flat (imported as `from models import ...`)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,135 @@
+import json
+import threading
+
+from batching import GeminiBatcher
+
+
+class FakeModel:
+    """Records prompts and answers batched prompts, optionally dropping ids."""
+
+    def __init__(self, drop_ids=()):
+        self.drop_ids = set(drop_ids)
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def send(self, prompt, phase):
+        with self._lock:
+            self.prompts.append(prompt)
+        if "=== REQUEST r0 ===" not in prompt:
+            return json.dumps({"answer": prompt}), "sig-single"
+        responses = []
+        for index in range(prompt.count("=== END REQUEST")):
+            request_id = f"r{index}"
+            if request_id in self.drop_ids:
+                continue
+            body = prompt.split(f"=== REQUEST {request_id} ===\n")[1].split("\n=== END")[0]
+            responses.append({"id": request_id, "response": {"answer": body}})
+        return json.dumps({"responses": responses}), "sig-batch"
+
+
+def _submit_concurrently(batcher, prompts, phase=2):
+    """Submit prompts from separate threads; returns {prompt: result or exception}."""
+    results = {}
+
+    def worker(prompt):
+        try:
+            results[prompt] = batcher.submit(prompt, phase)
+        except Exception as e:
+            results[prompt] = e
+
+    threads = [threading.Thread(target=worker, args=(prompt,)) for prompt in prompts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class HeldRequest:
+    """
+    Keeps one request on another phase in flight, so the batch leader waits
+    for the batch to fill instead of dispatching alone.
+    """
+
+    def __init__(self, batcher, model):
+        self.release = threading.Event()
+        self.sending = threading.Event()
+        self._model_send = model.send
+        self._thread = threading.Thread(target=batcher.submit, args=("held", 1))
+
+    def send(self, prompt, phase):
+        if prompt == "held":
+            self.sending.set()
+            self.release.wait(timeout=5)
+        return self._model_send(prompt, phase)
+
+    def __enter__(self):
+        self._thread.start()
+        self.sending.wait(timeout=5)
+        return self
+
+    def __exit__(self, *exc):
+        self.release.set()
+        self._thread.join(timeout=5)
+
+
+def _batched(model, batch_size):
+    """Batcher whose first submit is held in flight by the returned context manager."""
+    holder = {}
+    batcher = GeminiBatcher(lambda prompt, phase: holder["held"].send(prompt, phase),
+                            max_batch_size=batch_size, max_wait_ms=5000)
+    holder["held"] = HeldRequest(batcher, model)
+    return batcher, holder["held"]
+
+
+def test_single_request_is_sent_directly():
+    model = FakeModel()
+    batcher = GeminiBatcher(model.send, max_wait_ms=500)
+    assert batcher.submit("only", 2) == (json.dumps({"answer": "only"}), "sig-single")
+    assert model.prompts == ["only"]
+    assert batcher.batches_sent == 0
+
+
+def test_concurrent_requests_share_one_call():
+    model = FakeModel()
+    batcher, held = _batched(model, batch_size=4)
+    prompts = ["p0", "p1", "p2", "p3"]
+    with held:
+        results = _submit_concurrently(batcher, prompts)
+    assert len([prompt for prompt in model.prompts if prompt != "held"]) == 1
+    assert batcher.requests_batched == 4
+    for prompt in prompts:
+        assert json.loads(results[prompt][0]) == {"answer": prompt}
+
+
+def test_missing_response_id_is_retried_individually():
+    model = FakeModel(drop_ids={"r1"})
+    batcher, held = _batched(model, batch_size=3)
+    prompts = ["p0", "p1", "p2"]
+    with held:
+        results = _submit_concurrently(batcher, prompts)
+    model.prompts.remove("held")
+    assert len(model.prompts) == 2
+    assert len(results) == 3
+    for prompt in prompts:
+        assert json.loads(results[prompt][0]) == {"answer": prompt}
+    # Exactly one request fell back to a direct call
+    retried = [prompt for prompt in prompts if results[prompt][1] == "sig-single"]
+    assert len(retried) == 1
+    assert model.prompts[1] == retried[0]
+
+
+def test_send_error_reaches_every_caller():
+    def failing_send(prompt, phase):
+        raise RuntimeError("model unavailable")
+
+    batcher = GeminiBatcher(failing_send, max_batch_size=2, max_wait_ms=5000)
+    results = _submit_concurrently(batcher, ["a", "b"])
+    assert [str(results[prompt]) for prompt in ("a", "b")] == ["model unavailable"] * 2
+
+
+def test_unpack_handles_fences_and_garbage():
+    fenced = '```json\n{"responses": [{"id": "r0", "response": [1, 2]}, {"id": "r1"}]}\n```'
+    assert GeminiBatcher._unpack(fenced) == {"r0": "[1, 2]"}
+    assert GeminiBatcher._unpack("not json") == {}
+    assert GeminiBatcher._unpack('{"responses": "r0"}') == {}
@@ -0,0 +1,74 @@
+import pytest
+
+from claim_dedup import IncrementalClaimClusterer, cluster_claims, direction_signature
+from models import Claim
+
+
+def _claim(text, confidence=0.9, page=1):
+    return Claim(text=text, confidence=confidence, page=page, evidence_type="quantitative")
+
+
+OPPOSITE_PAIRS = [
+    (
+        "Inference latency drops by 40% compared to the baseline model on A100 GPUs.",
+        "Inference latency increases by 40% compared to the baseline model on A100 GPUs.",
+    ),
+    (
+        "Accuracy is higher than the baseline by 2% on ImageNet.",
+        "Accuracy is lower than the baseline by 2% on ImageNet.",
+    ),
+    (
+        "Our method outperforms the baseline by 3 points on GLUE.",
+        "Our method underperforms the baseline by 3 points on GLUE.",
+    ),
+    (
+        "Accuracy is higher than the baseline by 2% on ImageNet.",
+        "Accuracy is not higher than the baseline by 2% on ImageNet.",
+    ),
+]
+
+
+@pytest.mark.parametrize("first, second", OPPOSITE_PAIRS)
+def test_opposite_claims_are_never_merged(first, second):
+    claims = [_claim(first), _claim(second)]
+
+    assert len(cluster_claims(claims)) == 2
+
+    clusterer = IncrementalClaimClusterer()
+    assert clusterer.add(claims[0]) is True
+    assert clusterer.add(claims[1]) is True
+
+
+def test_opposite_claim_does_not_hide_a_true_duplicate():
+    up = "Inference latency increases by 40% compared to the baseline model on A100 GPUs."
+    down = "Inference latency drops by 40% compared to the baseline model on A100 GPUs."
+    clusters = cluster_claims([_claim(up), _claim(down), _claim(down.rstrip("."), page=7)])
+
+    assert sorted(len(c) for c in clusters) == [1, 2]
+
+
+def test_restated_claims_are_merged_with_highest_confidence_representative():
+    claims = [
+        _claim("Our model achieves 12% lower error on CIFAR-10 than ResNet", confidence=0.6, page=1),
+        _claim("Our model achieves 12.0% lower error on CIFAR-10 than ResNet.", confidence=0.95, page=6),
+    ]
+    clusters = cluster_claims(claims)
+
+    assert len(clusters) == 1
+    assert clusters[0][0].page == 6
+
+
+def test_different_numbers_are_not_merged():
+    claims = [
+        _claim("Our model achieves 12% lower error on CIFAR-10 than ResNet."),
+        _claim("Our model achieves 15% lower error on CIFAR-10 than ResNet."),
+    ]
+
+    assert len(cluster_claims(claims)) == 2
+
+
+def test_direction_signature():
+    assert direction_signature("Latency drops by 40%") == ("down",)
+    assert direction_signature("Accuracy increases by 2%") == ("up",)
+    assert direction_signature("Accuracy doesn't increase") == ("negated", "up")
+    assert direction_signature("We use 8 GPUs") == ()
@@ -0,0 +1,25 @@
+from figure_cache import FigureCache
+
+
+def test_entries_are_shared_between_instances(tmp_path):
+    path = str(tmp_path / "figures.sqlite3")
+    worker_a, worker_b = FigureCache(path), FigureCache(path)
+
+    worker_a.add("ffffffffffffffff", "bar chart")
+    worker_b.add("0000000000000000", "line plot")
+
+    # Each worker sees the other's entry, and near matches hit
+    assert worker_b.lookup("fffffffffffffff0")["description"] == "bar chart"
+    assert worker_a.lookup("0000000000000001")["description"] == "line plot"
+    assert worker_a.lookup("00000000ffffffff") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = FigureCache(str(tmp_path / "figures.sqlite3"), max_entries=2)
+
+    cache.add("ffffffffffffffff", "first")
+    cache.add("0000000000000000", "second")
+    cache.add("00000000ffffffff", "third")
+
+    assert cache.stats()["entries"] == 2
+    assert cache.lookup("ffffffffffffffff") is None
@@ -0,0 +1,52 @@
+from normalization import join_pages, normalize_text, split_pages
+
+
+HEADER = "Journal of Reproducible Results, Vol. 12"
+TABLE = "Method\nAccuracy\nOurs\n93.4\nBaseline\n91.2"
+TOPICS = ["datasets", "training", "ablations", "baselines", "scaling", "robustness", "limitations", "ethics"]
+
+
+def _paper(num_pages=8):
+    pages = []
+    for num in range(1, num_pages + 1):
+        topic = TOPICS[num - 1]
+        body = [HEADER, f"This section covers {topic}."]
+        if num % 2 == 0:
+            body.append(TABLE)
+        body += [f"We close the discussion of {topic} here.", str(num)]
+        pages.append((num, "\n".join(body) + "\n"))
+    return join_pages(pages)
+
+
+def test_repeated_header_removed_but_table_text_kept():
+    normalized, stats = normalize_text(_paper())
+
+    assert HEADER not in normalized
+    assert stats["repeated_lines_removed"] == 8
+    for num, page_text in split_pages(normalized):
+        if num % 2 == 0:
+            assert TABLE in page_text
+
+
+def test_table_column_is_not_stripped_as_line_numbers():
+    column = "\n".join(str(10 * i) for i in range(1, 13))
+    normalized, stats = normalize_text(f"\n--- PAGE 1 ---\nResults\n{column}\n")
+
+    assert column in normalized
+    assert stats["line_numbers_removed"] == 0
+
+
+def test_consecutive_line_numbers_stripped():
+    lines = "\n".join(f"{i}\nline of body text number {i}" for i in range(1, 15))
+    normalized, stats = normalize_text(f"\n--- PAGE 1 ---\n{lines}\n")
+
+    assert stats["line_numbers_removed"] == 14
+    assert "line of body text number 14" in normalized
+
+
+def test_hyphenation_keeps_compound_words():
+    normalized, _ = normalize_text("\n--- PAGE 1 ---\nstate-of-the-\nart and well-\nknown com-\nputers\n")
+
+    assert "state-of-the-art" in normalized
+    assert "well-known" in normalized
+    assert "computers" in normalized
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from stream_parser import JSONArrayStreamParser
+
+
+OBJECTS = [
+    {"claim": 'Table 2 reports "state-of-the-art" accuracy', "page": 3},
+    {"claim": "Braces {like} and [brackets] inside strings", "page": 4},
+    {"claim": "Backslash \\ then quote \\\" stays escaped", "nested": {"pages": [1, 2]}},
+]
+STREAM = "```json\n" + json.dumps(OBJECTS, indent=2) + "\n```"
+
+
+def _feed_in_chunks(text, size):
+    parser = JSONArrayStreamParser()
+    emitted = []
+    for start in range(0, len(text), size):
+        emitted.extend(parser.feed(text[start:start + size]))
+    return emitted
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, len(STREAM)])
+def test_objects_survive_any_chunk_split(size):
+    assert _feed_in_chunks(STREAM, size) == OBJECTS
+
+
+def test_object_is_emitted_as_soon_as_it_closes():
+    parser = JSONArrayStreamParser()
+    first = json.dumps(OBJECTS[0])
+    assert parser.feed("[" + first[:-1]) == []
+    assert parser.feed(first[-1] + ", {") == [OBJECTS[0]]
+
+
+def test_split_inside_escape_sequence():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('[{"claim": "a \\') == []
+    assert parser.feed('"} quoted"}]') == [{"claim": 'a "} quoted'}]
+
+
+def test_malformed_object_is_skipped_and_trailing_text_ignored():
+    parser = JSONArrayStreamParser()
+    emitted = parser.feed('[{"page": 1,}, {"page": 2}] trailing [{"page": 3}]')
+    assert emitted == [{"page": 2}]
@@ -4,8 +4,115 @@ Streamlit Frontend for PaperLens
 
 import streamlit as st
 import requests
+import hashlib
 import json
+import os
+import time
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POLL_INTERVAL_SECONDS = 1.5
+STAGE_PROGRESS = {
+    "queued": 0.05,
+    "ingesting": 0.2,
+    "normalizing": 0.35,
+    "auditing": 0.6,
+    "complete": 1.0,
+}
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Pooled HTTP session shared across reruns and browser sessions."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], allowed_methods=["GET"])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "PaperLens/1.0"})
+    return session
+
+
+@st.cache_resource
+def get_report_index() -> dict:
+    """(backend URL, file SHA-256) -> {"job_id": str, "report_id": str}, shared across sessions."""
+    return {}
+
+
+@st.cache_data(show_spinner=False, max_entries=100)
+def fetch_report(api_url: str, report_id: str) -> dict:
+    """Fetch a finished report once; later reruns are served from the cache."""
+    response = get_http_session().get(f"{api_url}/api/reports/{report_id}", timeout=30)
+    response.raise_for_status()
+    return response.json()["audit_report"]
+
+
+def render_report(audit: dict) -> None:
+    """Render an audit report."""
+    # Summary section
+    st.subheader("📋 Audit Summary")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Total Claims", len(audit["claims"]))
+    with col2:
+        st.metric("Contradictions Found", len(audit["contradictions"]))
+    with col3:
+        st.metric("Processing Time", f"{audit['processing_time_seconds']:.1f}s")
+    
+    st.info(audit["audit_summary"])
+    if audit.get("partial"):
+        exceeded = ", ".join((audit.get("budget_usage") or {}).get("exceeded", []))
+        st.warning(f"⚠️ Partial audit: resource budget exceeded ({exceeded})")
+    
+    st.divider()
+    
+    # Claims section
+    if audit["claims"]:
+        st.subheader("💡 Extracted Claims")
+        
+        for i, claim in enumerate(audit["claims"], 1):
+            with st.expander(f"Claim {i} - {claim['text'][:60]}..."):
+                st.write(f"**Text:** {claim['text']}")
+                st.write(f"**Confidence:** {claim['confidence']:.1%}")
+                st.write(f"**Type:** {claim['evidence_type']}")
+                st.write(f"**Page:** {claim['page']}")
+    
+    st.divider()
+    
+    # Contradictions section
+    if audit["contradictions"]:
+        st.subheader("⚠️ Detected Contradictions")
+        
+        for i, contradiction in enumerate(audit["contradictions"], 1):
+            with st.expander(
+                f"Contradiction {i} - {contradiction['contradiction_type'].replace('_', ' ').title()}",
+                expanded=True
+            ):
+                st.write(f"**Claim:** {contradiction['claim']}")
+                st.write(f"**Page with Visual Evidence:** {contradiction['visual_evidence_page']}")
+                st.write(f"**Visual Shows:** {contradiction['visual_shows']}")
+                st.write(f"**Confidence:** {contradiction['confidence']:.1%}")
+                
+                if contradiction.get("reasoning"):
+                    st.write(f"**Reasoning:** {contradiction['reasoning']}")
+    else:
+        st.success("✅ No contradictions detected! Paper is consistent.")
+    
+    st.divider()
+    
+    # Raw JSON export
+    st.subheader("📥 Raw Report (JSON)")
+    st.json(audit)
+    
+    # Download button
+    st.download_button(
+        "Download Report",
+        json.dumps(audit, indent=2),
+        file_name=f"paperlens_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
 
 # Page config
 st.set_page_config(
@@ -67,10 +174,36 @@ with st.sidebar:
     - Multimodal input (text + images)
     """)
 
-# Initialize session state for file uploads
-if 'uploaded_file_data' not in st.session_state:
-    st.session_state.uploaded_file_data = None
+# Initialize session state for file uploads; reports are looked up by file hash.
+# Only metadata is kept here: the PDF bytes stay in the uploader widget (or on
+# disk for the file-path option) and are read again only when submitting.
+if 'uploaded_file_hash' not in st.session_state:
     st.session_state.uploaded_file_name = None
+    st.session_state.uploaded_file_path = None  # Set for the file-path option
+    st.session_state.uploaded_file_hash = None
+    st.session_state.uploaded_file_size = 0
+    st.session_state.uploader_file_id = None
+
+
+def set_uploaded_file(name: str, data: bytes, path: str = None) -> None:
+    st.session_state.uploaded_file_name = name
+    st.session_state.uploaded_file_path = path
+    st.session_state.uploaded_file_hash = hashlib.sha256(data).hexdigest()
+    st.session_state.uploaded_file_size = len(data)
+
+
+def read_uploaded_file():
+    """PDF bytes of the current file, or None if it is no longer available."""
+    if st.session_state.uploaded_file_path:
+        try:
+            with open(st.session_state.uploaded_file_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    uploaded_file = st.session_state.get("pdf_uploader")
+    if uploaded_file is None or uploaded_file.file_id != st.session_state.uploader_file_id:
+        return None
+    return uploaded_file.getvalue()
 
 # Main section
 col1, col2 = st.columns([2, 1])
@@ -94,13 +227,11 @@ with col1:
         )
         
         if file_path and st.button("Load File", type="primary"):
-            import os
             full_path = f"/workspaces/gemini-hackathon/paperlens-multimodal-auditor/uploads/{file_path}"
             if os.path.exists(full_path):
                 with open(full_path, 'rb') as f:
                     pdf_data = f.read()
-                st.session_state.uploaded_file_data = pdf_data
-                st.session_state.uploaded_file_name = os.path.basename(full_path)
+                set_uploaded_file(os.path.basename(full_path), pdf_data, path=full_path)
                 st.success(f"✅ Loaded {len(pdf_data)} bytes from {file_path}")
             else:
                 st.error(f"❌ File not found: {full_path}")
@@ -111,124 +242,62 @@ with col1:
         uploaded_file = st.file_uploader(
             "Choose a PDF file",
             type=["pdf"],
-            help="Upload a research paper in PDF format"
+            help="Upload a research paper in PDF format",
+            key="pdf_uploader"
         )
         
-        if uploaded_file is not None:
-            st.session_state.uploaded_file_data = uploaded_file.read()
-            st.session_state.uploaded_file_name = uploaded_file.name
+        # Only re-read and re-hash when a different file is uploaded
+        if uploaded_file is not None and uploaded_file.file_id != st.session_state.uploader_file_id:
+            st.session_state.uploader_file_id = uploaded_file.file_id
+            set_uploaded_file(uploaded_file.name, uploaded_file.getvalue())
 
 with col2:
     st.subheader("📊 Status")
     status_placeholder = st.empty()
 
 # Process uploaded file
-if st.session_state.uploaded_file_data is not None:
+if st.session_state.uploaded_file_hash is not None:
     st.divider()
     
     # Show file info
     st.write(f"**File:** {st.session_state.uploaded_file_name}")
-    st.write(f"**Size:** {len(st.session_state.uploaded_file_data) / 1024:.1f} KB")
+    st.write(f"**Size:** {st.session_state.uploaded_file_size / 1024:.1f} KB")
     
     # Debug: Show backend URL
     st.caption(f"Backend: {api_url}")
     
-    if len(st.session_state.uploaded_file_data) > 200 * 1024 * 1024:
+    if st.session_state.uploaded_file_size > 200 * 1024 * 1024:
         st.warning("File is larger than 200MB and may fail to upload. Try a smaller PDF.")
     
+    session = get_http_session()
+    report_index = get_report_index()
+    index_key = (api_url, st.session_state.uploaded_file_hash)
+    entry = report_index.get(index_key, {})
+    
+    can_submit = not entry.get("job_id")
+    button_label = "🔁 Re-run Audit" if entry.get("report_id") else "🚀 Run Audit"
+    
     # Process button
-    if st.button("🚀 Run Audit", use_container_width=True, type="primary"):
-        status_placeholder.info("⏳ Processing... this may take 30-60 seconds")
-        
+    if st.button(button_label, use_container_width=True, type="primary", disabled=not can_submit):
         try:
-            # Send to backend using direct Python request (bypasses Streamlit's Axios client)
-            st.write("📡 Reading file...")
-            pdf_bytes = st.session_state.uploaded_file_data
-            st.write(f"✅ File read: {len(pdf_bytes)} bytes")
+            pdf_data = read_uploaded_file()
+            if pdf_data is None:
+                raise FileNotFoundError("The uploaded file is no longer available; please load it again.")
             
+            # Submit without waiting for the audit; progress is polled below
             st.write("📡 Sending to backend...")
-            files = {"file": (st.session_state.uploaded_file_name, pdf_bytes, "application/pdf")}
-            response = requests.post(
-                f"{api_url}/api/audit",
-                files=files,
-                timeout=120,
-                headers={"User-Agent": "PaperLens/1.0"}
-            )
-            st.write(f"✅ Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                if result["status"] == "success":
-                    status_placeholder.success("✅ Audit Complete")
-                    
-                    audit = result["audit_report"]
-                    
-                    # Summary section
-                    st.subheader("📋 Audit Summary")
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric("Total Claims", len(audit["claims"]))
-                    with col2:
-                        st.metric("Contradictions Found", len(audit["contradictions"]))
-                    with col3:
-                        st.metric("Processing Time", f"{audit['processing_time_seconds']:.1f}s")
-                    
-                    st.info(audit["audit_summary"])
-                    
-                    st.divider()
-                    
-                    # Claims section
-                    if audit["claims"]:
-                        st.subheader("💡 Extracted Claims")
-                        
-                        for i, claim in enumerate(audit["claims"], 1):
-                            with st.expander(f"Claim {i} - {claim['text'][:60]}..."):
-                                st.write(f"**Text:** {claim['text']}")
-                                st.write(f"**Confidence:** {claim['confidence']:.1%}")
-                                st.write(f"**Type:** {claim['evidence_type']}")
-                                st.write(f"**Page:** {claim['page']}")
-                    
-                    st.divider()
-                    
-                    # Contradictions section
-                    if audit["contradictions"]:
-                        st.subheader("⚠️ Detected Contradictions")
-                        
-                        for i, contradiction in enumerate(audit["contradictions"], 1):
-                            with st.expander(
-                                f"Contradiction {i} - {contradiction['contradiction_type'].replace('_', ' ').title()}",
-                                expanded=True
-                            ):
-                                st.write(f"**Claim:** {contradiction['claim']}")
-                                st.write(f"**Page with Visual Evidence:** {contradiction['visual_evidence_page']}")
-                                st.write(f"**Visual Shows:** {contradiction['visual_shows']}")
-                                st.write(f"**Confidence:** {contradiction['confidence']:.1%}")
-                                
-                                if contradiction.get("reasoning"):
-                                    st.write(f"**Reasoning:** {contradiction['reasoning']}")
-                    else:
-                        st.success("✅ No contradictions detected! Paper is consistent.")
-                    
-                    st.divider()
-                    
-                    # Raw JSON export
-                    st.subheader("📥 Raw Report (JSON)")
-                    st.json(audit)
-                    
-                    # Download button
-                    st.download_button(
-                        "Download Report",
-                        json.dumps(audit, indent=2),
-                        file_name=f"paperlens_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
-                    )
-                
-                else:
-                    status_placeholder.error("❌ Audit Failed")
-                    st.error(f"Error: {result.get('error_details', 'Unknown error')}")
+            files = {
+                "file": (
+                    st.session_state.uploaded_file_name,
+                    pdf_data,
+                    "application/pdf"
+                )
+            }
+            response = session.post(f"{api_url}/api/audit/jobs", files=files, timeout=60)
             
+            if response.status_code == 202:
+                entry = {"job_id": response.json()["job_id"]}
+                report_index[index_key] = entry
             else:
                 status_placeholder.error("❌ Server Error")
                 error_text = response.text.strip() or "(no response body)"
@@ -243,10 +312,52 @@ if st.session_state.uploaded_file_data is not None:
             status_placeholder.error(f"❌ Request Error")
             st.error(f"Request failed: {str(e)}")
             st.error(f"Error type: {type(e).__name__}")
+        except (KeyError, ValueError) as e:
+            # 202 without a job_id, or a body that is not JSON
+            status_placeholder.error("❌ Unexpected Response")
+            st.error(f"Backend returned an invalid job response: {type(e).__name__}: {str(e)}")
         except Exception as e:
-            status_placeholder.error(f"❌ Error: {str(e)}")
-            st.error(f"Unexpected error: {e}")
-            st.error(f"Error type: {type(e).__name__}")
+            status_placeholder.error("❌ Error")
+            st.error(f"Error: {str(e)}")
+    
+    if entry.get("job_id"):
+        # Poll the running job, then rerun to poll again
+        try:
+            response = session.get(f"{api_url}/api/audit/jobs/{entry['job_id']}", timeout=10)
+            response.raise_for_status()
+            job = response.json()
+            
+            if job["status"] == "complete":
+                report_index[index_key] = {"report_id": job["report_id"]}
+                st.rerun()
+            elif job["status"] == "failed":
+                report_index.pop(index_key, None)
+                status_placeholder.error("❌ Audit Failed")
+                st.error(f"Error: {job.get('error') or 'Unknown error'}")
+            else:
+                status_placeholder.info("⏳ Processing... this may take 30-60 seconds")
+                st.progress(
+                    STAGE_PROGRESS.get(job["stage"], 0.5),
+                    text=f"{job['stage'].title()} ({job['elapsed_seconds']:.0f}s)"
+                )
+                time.sleep(POLL_INTERVAL_SECONDS)
+                st.rerun()
+        
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            report_index.pop(index_key, None)
+            status_placeholder.error(f"❌ Request Error")
+            st.error(f"Lost track of audit job: {str(e)}")
+    
+    elif entry.get("report_id"):
+        # Served from st.cache_data after the first fetch
+        try:
+            audit = fetch_report(api_url, entry["report_id"])
+            status_placeholder.success("✅ Audit Complete")
+            render_report(audit)
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            report_index.pop(index_key, None)
+            status_placeholder.error(f"❌ Request Error")
+            st.error(f"Could not load report: {str(e)}")
 
 else:
     st.info("👆 Upload a PDF to get started")